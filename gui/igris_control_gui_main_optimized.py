@@ -1,7 +1,9 @@
 import os
 import sys
+import atexit
 import json
 import threading
+import queue
 import re
 import shlex
 import shutil
@@ -9,19 +11,28 @@ import tkinter as tk
 from tkinter import scrolledtext, messagebox, filedialog, ttk
 import subprocess
 from datetime import datetime, timedelta
+from collections import deque
 from pathlib import Path 
 from memory_manager import add_memory, add_conversation_memory, retrieve_conversation_memory, get_all_conversation_history
 import psutil
+import requests
 import speech_recognition as sr
 import pyttsx3
 import importlib.util
+import functools
 import time
 from concurrent.futures import ThreadPoolExecutor
 
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
 from igris_phase2_5_patch_integrated import learn_new_task_gui, find_best_local_match, show_task_intent_manager
 
 # === Configuration ===
 OLLAMA_MODEL = "hf.co/bartowski/Llama-3.2-1B-Instruct-GGUF:Q5_K_M"
+OLLAMA_URL = "http://localhost:11434/api/generate"
 MEMORY_FILE = os.path.expanduser(r"~\\OneDrive\\Documents\\ai_memory.json")
 LOG_FILE = os.path.expanduser(r"~\\OneDrive\\Documents\\ai_script_log.txt")
 HISTORY_DIR = os.path.expanduser(r"~\\OneDrive\\Documents\\ai_script_history")
@@ -29,19 +40,34 @@ POLICY_FILE = os.path.expanduser(r"~\\OneDrive\\Documents\\ai_script_policy.json
 ASSISTANT_IDENTITY_FILE = Path("ai_assistant_config/assistant_identity.json")
 CONFIG_DIR = Path("ai_assistant_config")
 PLUGINS_DIR = Path("plugins")
+COMMAND_HISTORY_LIMIT = 500
 
 os.makedirs(HISTORY_DIR, exist_ok=True)
 PLUGINS_DIR.mkdir(exist_ok=True)
 
 THREAD_POOL = ThreadPoolExecutor(max_workers=6)
+_CHECKUP_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkup")
+
+# One keep-alive connection to the Ollama daemon, reused for every turn
+OLLAMA_SESSION = requests.Session()
+OLLAMA_SESSION.headers.update({"Connection": "keep-alive"})
 
 # === Load Configurations ===
-def load_config(path):
+@functools.lru_cache(maxsize=16)
+def _load_config_cached(path, mtime_ns):
     try:
         return json.loads((CONFIG_DIR / path).read_text(encoding='utf-8'))
     except (FileNotFoundError, json.JSONDecodeError):
         return {}
 
+def load_config(path):
+    """Loads a JSON config from CONFIG_DIR, reparsing only when the file's mtime changes."""
+    try:
+        mtime_ns = (CONFIG_DIR / path).stat().st_mtime_ns
+    except OSError:
+        return {}
+    return _load_config_cached(path, mtime_ns)
+
 def load_identity_and_initialize():
     if not ASSISTANT_IDENTITY_FILE.exists():
         return {}
@@ -80,13 +106,69 @@ task_list_str += "--- END TASK LIST ---\n"
 base_context = base_context_template + task_list_str
 
 # === Text-to-Speech ===
-engine = pyttsx3.init()
-engine.setProperty('rate', 150) # Adjust speaking speed here
+TTS_QUEUE = queue.Queue()
+_TTS_STOP = object()  # sentinel that shuts the speech worker down
+_TTS_FAILED = threading.Event()  # set when the engine can't start; speak() then drops text
+
+def _tts_worker():
+    """Owns the pyttsx3 engine and speaks queued text, one utterance at a time."""
+    try:
+        if os.name == "nt":
+            # SAPI5 goes through COM, which must be initialised on every thread that uses it
+            import comtypes
+            comtypes.CoInitialize()
+        engine = pyttsx3.init()
+        engine.setProperty('rate', 150) # Adjust speaking speed here
+    except Exception as e:
+        print(f"[TTS Error] Speech engine unavailable: {e}")
+        _TTS_FAILED.set()
+        return
+    while True:
+        text = TTS_QUEUE.get()
+        if text is _TTS_STOP:
+            break
+        try:
+            engine.say(text)
+            engine.runAndWait()
+        except Exception as e:
+            print(f"[TTS Error] {e}")
+
+threading.Thread(target=_tts_worker, name="igris-tts", daemon=True).start()
+
+# === Logging ===
+LOG_QUEUE = queue.Queue()
+
+def _log_writer():
+    """Appends queued entries to LOG_FILE from a single background thread, opening it on first use."""
+    f = None
+    try:
+        while True:
+            entry = LOG_QUEUE.get()
+            if entry is None:
+                break
+            if f is None:
+                try:
+                    f = open(LOG_FILE, 'a', encoding='utf-8', buffering=1)
+                except OSError as e:
+                    print(f"[Log Error] Could not open {LOG_FILE}: {e}")
+                    return
+            f.write(entry)
+    finally:
+        if f is not None:
+            f.close()
+
+LOG_THREAD = threading.Thread(target=_log_writer, name="igris-log", daemon=True)
+LOG_THREAD.start()
+
+def _close_log():
+    LOG_QUEUE.put(None)
+    LOG_THREAD.join(timeout=2)
+
+atexit.register(_close_log)
 
 def log_to_file(content):
-    if policy.get("logging_enabled", True):
-        with open(LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(f"[{datetime.now()}]\n{content}\n\n")
+    if policy.get("logging_enabled", True) and LOG_THREAD.is_alive():
+        LOG_QUEUE.put(f"[{datetime.now()}]\n{content}\n\n")
 
 def save_to_history(script):
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -95,22 +177,40 @@ def save_to_history(script):
         f.write(script)
     return path
 
-def run_cmd(cmd_list):
-    """Executes a command list in a shell."""
-    command_str = " ".join(cmd_list)
+# Keep console programs from flashing a window; the flag only exists on Windows
+CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+START_CMD_RE = re.compile(r"^(?:cmd(?:\.exe)?\s+/c\s+)?start\s+(.+)$", re.IGNORECASE)
+
+@functools.lru_cache(maxsize=128)
+def split_command(command_str):
+    """Tokenizes a command line once; matched task actions repeat often."""
+    return tuple(shlex.split(command_str))
+
+def run_cmd(cmd):
+    """
+    Executes a command without an intermediate shell.
+    `cmd` may be an argument list or a command-line string; on Windows a string is
+    handed to CreateProcess as-is, elsewhere it is tokenized first.
+    """
+    if isinstance(cmd, str):
+        command_str = cmd
+        args = cmd if os.name == "nt" else list(split_command(cmd))
+    else:
+        command_str = " ".join(cmd)
+        args = cmd
     try:
-        # Using shell=True is necessary for many Windows-specific commands like 'start'
         proc = subprocess.run(
-            command_str,
+            args,
             capture_output=True,
             text=True,
-            shell=True,
+            shell=False,
             check=False,
             encoding='utf-8',
-            errors='replace'
+            errors='replace',
+            creationflags=CREATE_NO_WINDOW
         )
     except FileNotFoundError:
-        return f"[ERROR] Command not found: '{cmd_list[0]}'"
+        return f"[ERROR] Command not found: '{command_str}'"
     except subprocess.CalledProcessError as e:
         if e.returncode == 1 and "Access is denied" in (e.stderr or e.stdout):
             return f"[ERROR] Permission denied: '{command_str}'. Ensure you have necessary privileges."
@@ -126,6 +226,15 @@ def run_cmd(cmd_list):
         return f"[ERROR] Command '{command_str}' returned {proc.returncode}: {err or out}"
     return out if out else "Command executed."
 
+def start_target(action):
+    """Returns the target of a `[cmd /c] start <target>` action, or None."""
+    match = START_CMD_RE.match(action.strip())
+    return match.group(1).strip().strip('"') if match else None
+
+def _collect_checkup_report():
+    """Builds the daily checkup report (runs on _CHECKUP_POOL)."""
+    return f"[Daily Checkup]\n{get_system_status_report()}\n"
+
 def get_system_status_report():
     """Collects and formats a system status report."""
     cpu = psutil.cpu_percent(interval=0.1)
@@ -139,14 +248,27 @@ def get_system_status_report():
 
     )
 
+# Local review routes, tried in priority order; each alternative is a
+# zero-width lookahead anchored at the start, so one search picks the route.
+REVIEW_ROUTE_RE = re.compile(
+    r"^(?:(?P<sysstat>(?=.*system)(?=.*stat(?:us|s)))"
+    r"|(?P<cpu>(?=.*cpu)(?=.*status))"
+    r"|(?P<uptime>(?=.*uptime))"
+    r"|(?P<disk>(?=.*disk (?:space|usage))))",
+    re.IGNORECASE | re.DOTALL
+)
+
 def respond_with_review(user_input):
     """Handles local system status queries without calling the LLM."""
-    user_input_lower = user_input.lower()
+    match = REVIEW_ROUTE_RE.search(user_input)
+    if not match:
+        return None
+    route = match.lastgroup
     # General system status query
-    if "system" in user_input_lower and ("status" in user_input_lower or "stats" in user_input_lower):
+    if route == "sysstat":
         return get_system_status_report()
     # Specific CPU/Memory query
-    if "cpu" in user_input_lower and "status" in user_input_lower:
+    if route == "cpu":
         cpu = psutil.cpu_percent(interval=0.1)
         mem = psutil.virtual_memory()
         return review_templates.get("reviews", {}).get("cpu_memory", "").format(
@@ -156,30 +278,30 @@ def respond_with_review(user_input):
             mem_total=round(mem.total / (1024 ** 3), 1)
         )
     # Uptime query
-    if "uptime" in user_input_lower:
+    if route == "uptime":
         return get_system_uptime()
-    if "disk space" in user_input_lower or "disk usage" in user_input_lower:
-        disk = psutil.disk_usage("C:\\")
-        return f"Disk Usage (C:\\): {disk.percent}% ({disk.free // (1024 ** 3)} GB free / {disk.total // (1024 ** 3)} GB total)"
-    return None
+    # Disk space/usage query
+    disk = psutil.disk_usage("C:\\")
+    return f"Disk Usage (C:\\): {disk.percent}% ({disk.free // (1024 ** 3)} GB free / {disk.total // (1024 ** 3)} GB total)"
 
 def show_policy_editor(root):
     top = tk.Toplevel(root)
     top.title("Edit Policy File")
     editor = scrolledtext.ScrolledText(top, wrap=tk.WORD)
     editor.pack(fill=tk.BOTH, expand=True)
-    try:
-        editor.insert(tk.END, Path(POLICY_FILE).read_text())
-    except:
-        editor.insert(tk.END, "{}")
+    # The in-memory policy mirrors the file, so there is no need to re-read it
+    editor.insert(tk.END, json.dumps(policy, indent=2))
     def save():
         try:
-            json.loads(editor.get("1.0", tk.END))
-            with open(POLICY_FILE, 'w', encoding='utf-8') as f:
-                f.write(editor.get("1.0", tk.END))
-            top.destroy()
-        except:
+            edited = json.loads(editor.get("1.0", tk.END))
+        except json.JSONDecodeError:
             messagebox.showerror("Invalid JSON", "The policy file is not valid JSON.")
+            return
+        policy.clear()
+        policy.update(edited)
+        root._cache_blocked_phrases()
+        root.flush_policy()
+        top.destroy()
     tk.Button(top, text="Save", command=save).pack()
 
 def show_fingerprint_prompt(root):
@@ -199,21 +321,54 @@ def show_fingerprint_prompt(root):
     return bool(confirmed)
 
 def speak(text):
-    engine.say(text)
-    engine.runAndWait()
+    """Queues text for the speech worker; never blocks the caller."""
+    if not _TTS_FAILED.is_set():
+        TTS_QUEUE.put(text)
+
+def stop_speaking():
+    TTS_QUEUE.put(_TTS_STOP)
+
+_recognizer = None
+_voice_source = None
+
+def _close_voice_input():
+    global _voice_source
+    if _voice_source is not None:
+        _voice_source.__exit__(None, None, None)
+        _voice_source = None
+
+def get_voice_input():
+    """Opens the microphone once and calibrates for ambient noise on first use."""
+    global _recognizer, _voice_source
+    if _voice_source is None:
+        recognizer = sr.Recognizer()
+        source = sr.Microphone().__enter__()  # stream stays open for the process lifetime
+        try:
+            recognizer.adjust_for_ambient_noise(source)
+        except Exception:
+            source.__exit__(None, None, None)  # don't leak a PortAudio stream per failed attempt
+            raise
+        if _recognizer is None:
+            atexit.register(_close_voice_input)
+        _recognizer, _voice_source = recognizer, source
+    return _recognizer, _voice_source
+
+def recalibrate_voice_input():
+    if _voice_source is None:
+        get_voice_input()  # opening the microphone calibrates it
+        return
+    _recognizer.adjust_for_ambient_noise(_voice_source)
 
 def confirm_by_voice(chat_area, expected_phrase="yes allow this"):
     try:
-        recognizer = sr.Recognizer()
+        recognizer, source = get_voice_input()
     except Exception as e:
+        chat_area.insert(tk.END, f"[Voice Error] {str(e)}\n")
         return False
-    mic = sr.Microphone()
     try:
-        with mic as source:
-            chat_area.insert(tk.END, "[Voice Auth] Listening for confirmation...\n")
-            chat_area.see(tk.END)
-            recognizer.adjust_for_ambient_noise(source)
-            audio = recognizer.listen(source, timeout=2, phrase_time_limit=3)
+        chat_area.insert(tk.END, "[Voice Auth] Listening for confirmation...\n")
+        chat_area.see(tk.END)
+        audio = recognizer.listen(source, timeout=2, phrase_time_limit=3)
         spoken = recognizer.recognize_google(audio, language="en-US").lower()
         return expected_phrase in spoken
     except Exception as e:
@@ -248,11 +403,9 @@ def prompt_for_pin(root, pin_hash):
     return bool(confirmed)
 
 
-def ask_ollama(prompt):
-    import subprocess
-    try:
-        # Hardcoded task map for matching
-        intent_prompt = """
+# Hardcoded task map for matching; sent as the system prompt so Ollama can
+# reuse the cached prefix and only the user request changes per turn.
+INTENT_SYSTEM_PROMPT = """
 You are Igris, an AI trained to match user requests to known Windows tasks.
 
 Match the user input to one of the tasks below and return a response like:
@@ -264,45 +417,112 @@ Tasks:
   requires_admin: true
 
 - task: empty recycle bin
-  action: PowerShell -Command "$shell = New-Object -ComObject Shell.Application; $shell.NameSpace(0xA).Items() | %%{$_.InvokeVerb('delete')}"
+  action: PowerShell -Command "$shell = New-Object -ComObject Shell.Application; $shell.NameSpace(0xA).Items() | %{$_.InvokeVerb('delete')}"
   requires_admin: true
 
 - task: open word
   action: cmd /c start winword
   requires_admin: false
+"""
 
-User request: {}
-""".format(prompt.strip())
-
-        result = subprocess.run(
-            ["ollama", "run", OLLAMA_MODEL],
-            input=intent_prompt,
-            capture_output=True,
-            text=True,
-            timeout=30,
-            encoding='utf-8'
-        )
-        if result.returncode != 0:
-            return f"[FATAL] Ollama error: {result.stderr.strip()}"
-        return result.stdout.strip()
+def ask_ollama(prompt, on_chunk=None):
+    """Streams a reply from Ollama, passing each text fragment to on_chunk as it arrives."""
+    try:
+        with OLLAMA_SESSION.post(
+            OLLAMA_URL,
+            json={
+                "model": OLLAMA_MODEL,
+                "system": INTENT_SYSTEM_PROMPT,
+                "prompt": f"User request: {prompt.strip()}",
+                "stream": True
+            },
+            stream=True,
+            timeout=30
+        ) as resp:
+            if resp.status_code != 200:
+                return f"[FATAL] Ollama error: {resp.text.strip()}"
+            parts = []
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if "error" in chunk:
+                    return f"[FATAL] Ollama error: {chunk['error']}"
+                piece = chunk.get("response", "")
+                if piece:
+                    parts.append(piece)
+                    if on_chunk:
+                        on_chunk(piece)
+                if chunk.get("done"):
+                    break
+        return "".join(parts).strip()
     except Exception as e:
         return f"[FATAL] Exception: {e}"
+BLOCK_SPLIT_RE = re.compile(r'\n\s*\n')
+
 def clean_ai_response(response):
     """
     Cleans the AI's response by removing preliminary "thinking" or reasoning steps.
     It assumes the final, intended answer is the last block of text.
     """
-    # Split the response into blocks separated by one or more empty lines.
-    blocks = re.split(r'\n\s*\n', response.strip())
+    text = response.strip()
+    # Blocks are separated by one or more empty lines; only the end of the
+    # last separator matters, so walk the matches instead of splitting.
+    last_end = 0
+    for match in BLOCK_SPLIT_RE.finditer(text):
+        last_end = match.end()
 
-    # Filter out any empty blocks that might result from splitting.
-    non_empty_blocks = [b.strip() for b in blocks if b.strip()]
+    # The last block is assumed to be the final answer.
+    return text[last_end:].strip()
 
-    if not non_empty_blocks:
-        return ""
+JSON_TOKEN_RE = re.compile(r'[{}"\\]')
+TASK_JSON_KEYS = ("task_name", "action", "requires_admin")
 
-    # Return the last non-empty block, which is assumed to be the final answer.
-    return non_empty_blocks[-1]
+def find_json_object(text):
+    """
+    Returns the first brace-balanced {...} span in text, or None.
+    Braces inside JSON strings are ignored, so nested objects are kept whole.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    skip_to = start
+    for match in JSON_TOKEN_RE.finditer(text, start):
+        i = match.start()
+        if i < skip_to:
+            continue  # character escaped by a preceding backslash
+        c = match.group()
+        if in_string:
+            if c == "\\":
+                skip_to = i + 2
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+def parse_task_json(raw_json):
+    """Parses a task object, reading only the fields the GUI uses when simdjson is available."""
+    if simdjson is None:
+        parsed = json.loads(raw_json)
+        for key in TASK_JSON_KEYS:
+            if key not in parsed:
+                raise KeyError(f"Missing key: '{key}'")
+        return parsed
+
+    doc = simdjson.Parser().parse(raw_json.encode("utf-8"))
+    parsed = {key: doc[key] for key in TASK_JSON_KEYS}
+    if "reasoning" in doc:
+        parsed["reasoning"] = doc["reasoning"]
+    return parsed
 
 def prompt_username(root):
     top = tk.Toplevel()
@@ -331,8 +551,14 @@ THEMES = {
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
-        self.command_history = []
-        self.history_index = None
+        self.command_history = deque(maxlen=COMMAND_HISTORY_LIMIT)
+        self.history_index = None  # offset from the newest entry (1 = newest), None when not browsing
+        self._blocked_phrases_lower = ()
+        self._tts_enabled = False
+        self._plugin_cache = {}  # file name -> (mtime, module, description)
+        self._policy_flush_id = None
+        self._policy_written = json.dumps(policy, indent=2)
+        self._fallback_msg = identity.get("fallback_behavior", {}).get("on_no_match")
         
     def run_startup_tasks(self):
         self.build_ui()
@@ -342,20 +568,18 @@ class App(tk.Tk):
              assistant_name = identity.get("name", "AI")
              greeting = f"Welcome back, {username}. I'm {assistant_name}, ready to assist."
              self.chat_area.insert(tk.END, f"--- {greeting} ---\n\n")
-             if self.tts_enabled_var.get():
+             if self._tts_enabled:
                 speak(greeting)
              # Auto-run plugins on startup
              for plugin_name in policy.get("autorun_plugins", []):
                  try:
                      plugin_file = PLUGINS_DIR / f"{plugin_name}.py"
                      if plugin_file.exists():
-                         spec = importlib.util.spec_from_file_location(plugin_name, plugin_file)
-                         mod = importlib.util.module_from_spec(spec)
-                         spec.loader.exec_module(mod)
+                         mod, _ = self._load_plugin(plugin_file)
                          if hasattr(mod, "run"):
                              result = mod.run()
                              self.chat_area.insert(tk.END, f"[Autorun Plugin] {plugin_name} -> {result}\n")
-                             if self.tts_enabled_var.get():
+                             if self._tts_enabled:
                                  speak(f"{plugin_name} launched.")
                      else:
                          self.chat_area.insert(tk.END, f"[Autorun Plugin Error] {plugin_name} not found.\n")
@@ -392,13 +616,15 @@ class App(tk.Tk):
         except json.JSONDecodeError:
             if not resp or resp.startswith("[FATAL]"):
                 self.report_error(resp or "[AI Error] No response from model.")
-                self.chat_area.insert(tk.END, f"[DEBUG - Raw AI Response]:\n{resp}\n\n")
+                self._append_chat([f"[DEBUG - Raw AI Response]:\n{resp}\n\n"])
                 return
 
             cleaned = clean_ai_response(resp)
-            self.chat_area.insert(tk.END, f"AI: {cleaned}\n\n")
-            self.chat_area.insert(tk.END, f"[DEBUG - Full AI Response]:\n{resp}\n\n")
-            if self.tts_enabled_var.get():
+            self._append_chat([
+                f"AI: {cleaned}\n\n",
+                f"[DEBUG - Full AI Response]:\n{resp}\n\n",
+            ])
+            if self._tts_enabled:
                 speak(cleaned)
             add_conversation_memory(user_req, cleaned)
 
@@ -412,36 +638,39 @@ class App(tk.Tk):
         reasoning = data.get('reasoning', "")
         requires_admin = data.get('requires_admin', False)
         enforce_on_tasks = identity.get("enforce_on_tasks", [])
+        out = []  # flushed before every modal prompt and once at the end
 
-        self.chat_area.insert(tk.END, f"AI Decision: Matched task '{task_name}'.\n")
-        self.chat_area.insert(tk.END, f"AI Reasoning: {reasoning}\n")
-        self.chat_area.insert(tk.END, "[INTENT] Task: {} | Action: {} | Admin: {}\n".format(task_name, action, requires_admin))
+        out.append(f"AI Decision: Matched task '{task_name}'.\n")
+        out.append(f"AI Reasoning: {reasoning}\n")
+        out.append("[INTENT] Task: {} | Action: {} | Admin: {}\n".format(task_name, action, requires_admin))
         self._log_message("Matched Task", f"Task: {task_name}, Action: {action}, Reasoning: {reasoning}")
 
  # Check if the task requires admin rights or is in the enforced list.
         if requires_admin or task_name in enforce_on_tasks: # This line was unindented
-                self.chat_area.insert(tk.END, "[SECURITY] This task requires admin confirmation.\n")
+                out.append("[SECURITY] This task requires admin confirmation.\n")
                 self._log_message("Security", f"Admin confirmation required for task: {task_name}")
 
         if policy.get("fingerprint_required", True):
+            self._append_chat(out)
             if not show_fingerprint_prompt(self):
-                self.chat_area.insert(tk.END, "[SECURITY] Fingerprint failed. Trying PIN...\n")
+                self._append_chat(["[SECURITY] Fingerprint failed. Trying PIN...\n"])
                 pin_hash = policy.get("admin_pin_hash", "")
                 if not prompt_for_pin(self, pin_hash):
-                        self.chat_area.insert(tk.END, "[SECURITY] PIN failed. Trying voice...\n")
+                        self._append_chat(["[SECURITY] PIN failed. Trying voice...\n"])
                         if not confirm_by_voice(self.chat_area):
-                            self.chat_area.insert(tk.END, "[SECURITY] All authentication methods failed.\n")
+                            self._append_chat(["[SECURITY] All authentication methods failed.\n"])
                             self._log_message("Security", f"Authentication failed for task: {task_name}")
                             return
                         else:
-                            self.chat_area.insert(tk.END, "[SECURITY] Voice confirmation accepted.\n")
+                            out.append("[SECURITY] Voice confirmation accepted.\n")
                 else:
-                    self.chat_area.insert(tk.END, "[SECURITY] PIN accepted.\n")
+                    out.append("[SECURITY] PIN accepted.\n")
             else:
-                self.chat_area.insert(tk.END, "[SECURITY] Fingerprint accepted.\n")
+                out.append("[SECURITY] Fingerprint accepted.\n")
         else:
-            self.chat_area.insert(tk.END, "[SECURITY] Fingerprint not required.\n")
-            self.chat_area.insert(tk.END, "[SECURITY] Confirmation failed. Task cancelled.\n\n")
+            out.append("[SECURITY] Fingerprint not required.\n")
+            out.append("[SECURITY] Confirmation failed. Task cancelled.\n\n")
+            self._append_chat(out)
             self._log_message("Security", f"Admin confirmation failed for task: {task_name}")
             return
             self.chat_area.insert(tk.END, "[SECURITY] Confirmation successful.\n")
@@ -451,20 +680,36 @@ class App(tk.Tk):
         if self.auto_execute.get():
             THREAD_POOL.submit(self._execute_task, action)
         else:
-            self.chat_area.insert(tk.END, "[INFO] Auto-execute is off. Command not run.\n\n")
+            out.append("[INFO] Auto-execute is off. Command not run.\n\n")
+        self._append_chat(out)
 
     def _execute_task(self, cmd_action):
         """Helper method to execute a command and update status."""
         self.update_status(f"Executing: {cmd_action[:30]}...")
-        result = run_cmd(shlex.split(cmd_action))
-        self.after(0, lambda: self.chat_area.insert(tk.END, f"Result: {result}\n\n"))
+        target = start_target(cmd_action)
+        if target and hasattr(os, "startfile"):
+            # Shell-open the target directly instead of spawning cmd.exe for `start`
+            try:
+                os.startfile(target)
+                result = f"Started {target}."
+            except OSError as e:
+                result = f"[ERROR] Could not start '{target}': {e}"
+        else:
+            result = run_cmd(cmd_action)
+        self.after(0, self._append_chat, [f"Result: {result}\n\n"])
         self.after(0, self.update_status)
 
+    def _append_chat(self, buf):
+        """Writes buffered chat lines with a single Text insert, then clears the buffer."""
+        if buf:
+            self.chat_area.insert(tk.END, "".join(buf))
+            self.chat_area.see(tk.END)
+            buf.clear()
+
     def _add_ai_response(self, text):
         """Helper method to safely add AI response to chat area."""
-        self.after(0, lambda: self.chat_area.insert(tk.END, f"AI: {text}\n\n"))
-        self.after(0, self.chat_area.see, tk.END)
-        if self.tts_enabled_var.get():
+        self.after(0, self._append_chat, [f"AI: {text}\n\n"])
+        if self._tts_enabled:
             speak(text)
 
     def run_plugin(self, plugin_module):
@@ -480,17 +725,27 @@ class App(tk.Tk):
         finally:
             self.update_status()
 
+    def _load_plugin(self, file):
+        """Returns (module, description) for a plugin file, re-executing it only when its mtime changes."""
+        mtime = file.stat().st_mtime
+        cached = self._plugin_cache.get(file.name)
+        if cached and cached[0] == mtime:
+            return cached[1], cached[2]
+        spec = importlib.util.spec_from_file_location(file.stem, file)
+        if spec is None:
+            raise ImportError(f"Could not load module spec for {file}")
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)  # Ensure the module is fully loaded
+        description = mod.__doc__.strip() if mod.__doc__ else "No description provided."
+        self._plugin_cache[file.name] = (mtime, mod, description)
+        return mod, description
+
     def load_plugins(self):
         """Loads plugins from the plugins directory, extracting metadata and handling errors."""
         plugins = []
         for file in PLUGINS_DIR.glob("*.py"):
             try:
-                spec = importlib.util.spec_from_file_location(file.stem, file)
-                if spec is None:
-                    raise ImportError(f"Could not load module spec for {file}")
-                mod = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(mod)  # Ensure the module is fully loaded
-                description = mod.__doc__.strip() if mod.__doc__ else "No description provided."
+                mod, description = self._load_plugin(file)
                 plugins.append({'name': file.stem, 'module': mod, 'description': description})
             except Exception as e:
                 self.report_error(f"[Plugin Load Error] {file.stem}: {e}")
@@ -499,8 +754,11 @@ class App(tk.Tk):
     def load_configs(self):
         global policy, identity, base_context, review_templates
         policy = load_policy()
+        self._policy_written = json.dumps(policy, indent=2)
         identity = load_identity_and_initialize()
+        self._fallback_msg = identity.get("fallback_behavior", {}).get("on_no_match")
 
+        _load_config_cached.cache_clear()  # explicit reload: drop every cached config
         task_intents = load_config("task_intents.json")
         review_templates = load_config("review_templates.json")
 
@@ -511,6 +769,10 @@ class App(tk.Tk):
             task_list_str += f"- Task: {task.get('task')}, Action: `{task.get('action')}`, Phrases: {task.get('phrases')}\n"
         task_list_str += "--- END TASK LIST ---\n"
         base_context = base_context_template + task_list_str
+        self._cache_blocked_phrases()
+
+    def _cache_blocked_phrases(self):
+        self._blocked_phrases_lower = tuple(p.lower() for p in policy.get("blocked_phrases", []))
     
     def show_plugin_menu(self):
         plugins = self.load_plugins()
@@ -566,23 +828,27 @@ class App(tk.Tk):
         # --- Menu Bar ---
         self.auto_execute = tk.BooleanVar(value=policy.get("auto_execute_default", True))
         self.tts_enabled_var = tk.BooleanVar(value=policy.get("tts_enabled", True))
+        self._tts_enabled = self.tts_enabled_var.get()
+        self.tts_enabled_var.trace_add("write", lambda *_: setattr(self, "_tts_enabled", self.tts_enabled_var.get()))
+        menu_bg = THEMES.get(policy.get("theme", "Dark"), THEMES["Dark"])["bg"]
         
         menu_bar = tk.Menu(self)
         self.config(menu=menu_bar)
 
-        file_menu = tk.Menu(menu_bar, tearoff=0, bg=THEMES[policy.get("theme", "Dark")]["bg"])
+        file_menu = tk.Menu(menu_bar, tearoff=0, bg=menu_bg)
         menu_bar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Export Chat...", command=self.export_chat)
         file_menu.add_command(label="Import Chat...", command=self.import_chat)
         file_menu.add_separator() 
         file_menu.add_command(label="Exit", command=self.quit)
 
-        tools_menu = tk.Menu(menu_bar, tearoff=0, bg=THEMES[policy.get("theme", "Dark")]["bg"])
+        tools_menu = tk.Menu(menu_bar, tearoff=0, bg=menu_bg)
         tools_menu.add_command(label="Run Plugin...", command=lambda: self.show_plugin_menu())
         tools_menu.add_command(label="Run Daily Checkup", command=self.run_daily_checkup)
+        tools_menu.add_command(label="Recalibrate Microphone", command=lambda: THREAD_POOL.submit(recalibrate_voice_input))
         tools_menu.add_separator()
         tools_menu.add_command(label="Edit Policy File...", command=lambda: show_policy_editor(self))
-        options_menu = tk.Menu(menu_bar, tearoff=0, bg=THEMES[policy.get("theme", "Dark")]["bg"])
+        options_menu = tk.Menu(menu_bar, tearoff=0, bg=menu_bg)
         menu_bar.add_cascade(label="Tools", menu=tools_menu)
         menu_bar.add_cascade(label="Options", menu=options_menu)
         options_menu.add_checkbutton(label="Auto-Execute Matched Tasks", variable=self.auto_execute, command=self.save_policy)
@@ -647,29 +913,53 @@ class App(tk.Tk):
 
     def save_policy(self, theme=None):
         policy["auto_execute_default"] = self.auto_execute.get()
-        policy["tts_enabled"] = self.tts_enabled_var.get()
+        policy["tts_enabled"] = self._tts_enabled
         if theme:
             policy["theme"] = theme
-        Path(POLICY_FILE).write_text(json.dumps(policy, indent=2), encoding='utf-8')
+        self._cache_blocked_phrases()
+        # Coalesce rapid toggles/theme clicks into a single write
+        if self._policy_flush_id is None:
+            self._policy_flush_id = self.after(500, self.flush_policy)
+
+    def flush_policy(self):
+        """Writes the policy file if it differs from what was last loaded or written."""
+        if self._policy_flush_id is not None:
+            try:
+                self.after_cancel(self._policy_flush_id)
+            except tk.TclError:
+                pass  # window already destroyed on shutdown
+            self._policy_flush_id = None
+        text = json.dumps(policy, indent=2)
+        if text == self._policy_written:
+            return
+        Path(POLICY_FILE).write_text(text, encoding='utf-8')
+        self._policy_written = text
+
     def on_entry_key(self, event):
         if event.keysym == "Up":
             if self.command_history:
                 if self.history_index is None:
-                    self.history_index = len(self.command_history) - 1
-                elif self.history_index > 0:
-                    self.history_index -= 1
+                    self.history_index = 1
+                elif self.history_index < len(self.command_history):
+                    self.history_index += 1
                 self.entry.delete(0, tk.END)
-                self.entry.insert(0, self.command_history[self.history_index])
+                self.entry.insert(0, self.command_history[-self.history_index])
         elif event.keysym == "Down":
             if self.command_history and self.history_index is not None:
-                if self.history_index < len(self.command_history) - 1:
-                    self.history_index += 1
+                if self.history_index > 1:
+                    self.history_index -= 1
                     self.entry.delete(0, tk.END)
-                    self.entry.insert(0, self.command_history[self.history_index])
+                    self.entry.insert(0, self.command_history[-self.history_index])
                 else:
                     self.entry.delete(0, tk.END)
                     self.history_index = None
 
+    def _remember_command(self, command):
+        """Appends to the bounded history, skipping immediate repeats."""
+        if not self.command_history or self.command_history[-1] != command:
+            self.command_history.append(command)
+        self.history_index = None
+
     def send_request(self):
         try:
             user_req = self.entry.get().strip()
@@ -682,14 +972,13 @@ class App(tk.Tk):
                 return
 
             self.update_status(f"Last input: {user_req[:30]}")
-            self.command_history.append(user_req)
-            self.history_index = None
+            self._remember_command(user_req)
             self.entry.delete(0, tk.END)
             self.chat_area.insert(tk.END, f"> {user_req}\n")
             self.chat_area.see(tk.END)
             log_to_file(f"USER: {user_req}")
 
-            if self.tts_enabled_var.get():
+            if self._tts_enabled:
                 speak(f"You said: {user_req}")
 
             review = respond_with_review(user_req)
@@ -697,10 +986,10 @@ class App(tk.Tk):
                 self.chat_area.insert(tk.END, f"System Review:\n{review}\n")
                 return
 
-            for phrase in policy.get("blocked_phrases", []):
-                if phrase.lower() in user_req.lower():
-                    self.chat_area.insert(tk.END, f"[SECURITY] This request is blocked by policy.\n")
-                    return
+            user_req_lower = user_req.lower()
+            if any(phrase in user_req_lower for phrase in self._blocked_phrases_lower):
+                self.chat_area.insert(tk.END, f"[SECURITY] This request is blocked by policy.\n")
+                return
 
             def worker():
                 recent_conversation = retrieve_conversation_memory(user_req, top_n=3)
@@ -725,11 +1014,12 @@ class App(tk.Tk):
                     "No extra commentary, headers, or markdown blocks."
                 )
 
-                response = ask_ollama(prompt)
-
                 # --- DEBUG PATCH START ---
+                # Show the raw reply progressively as tokens arrive
+                self.after(0, self._append_chat, ["\n[DEBUG] Raw AI Response:\n"])
+                response = ask_ollama(prompt, on_chunk=lambda piece: self.after(0, self._append_chat, [piece]))
                 print("[DEBUG] Raw LLM Output:\n", response)
-                self.chat_area.insert(tk.END, f"\n[DEBUG] Raw AI Response:\n{response}\n\n")
+                self.after(0, self._append_chat, ["\n\n"])
                 # --- DEBUG PATCH END ---
 
                 self.after(0, self.handle_response, response, user_req)
@@ -741,8 +1031,7 @@ class App(tk.Tk):
 
     def handle_slash_command(self, command):
         """Handles local client-side commands like /history."""
-        self.command_history.append(command)
-        self.history_index = None
+        self._remember_command(command)
         self.entry.delete(0, tk.END)
         self.chat_area.insert(tk.END, f"> {command}\n")
 
@@ -773,68 +1062,60 @@ class App(tk.Tk):
         self.apply_theme(self.theme_var.get())
 
     def run_daily_checkup(self):
-        from datetime import time
-        from concurrent.futures import ThreadPoolExecutor
-        self.chat_area.insert(tk.END, "[Daily Checkup] Starting system health check...\n")
-        report_body = get_system_status_report()
-        report = f"[Daily Checkup]\n{report_body}\n"
-        self.chat_area.insert(tk.END, report)
-        if self.tts_enabled_var.get():
+        """Collects the status report on a worker so the GUI stays responsive."""
+        self._append_chat(["[Daily Checkup] Starting system health check...\n"])
+        future = _CHECKUP_POOL.submit(_collect_checkup_report)
+        future.add_done_callback(lambda f: self.after(0, self._finish_checkup, f))
+
+    def _finish_checkup(self, future):
+        """Reports the checkup result on the Tk thread and schedules the next run."""
+        try:
+            report = future.result()
+        except Exception as e:
+            report = f"[Daily Checkup]\nCheckup failed: {e}\n"
+        else:
+            # memory_manager isn't locked, so only the Tk thread writes memory
+            add_memory(report)
+        if self._tts_enabled:
             speak("Daily checkup complete. Please review the system report.")
-        add_memory(report)
         now = datetime.now()
         next_checkup_time = now.replace(hour=9, minute=0, second=0, microsecond=0)
         if next_checkup_time <= now:
             next_checkup_time += timedelta(days=1)
         delay = (next_checkup_time - now).total_seconds()
         self.after(int(delay * 1000), self.run_daily_checkup)
-        self.chat_area.insert(tk.END, f"[Daily Checkup] Next check scheduled for {next_checkup_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        self._append_chat([report, f"[Daily Checkup] Next check scheduled for {next_checkup_time.strftime('%Y-%m-%d %H:%M:%S')}\n"])
         log_to_file(f"DAILY CHECKUP:\n{report}")
     
     def _extract_json_from_response(self, resp, user_req):
         """Extracts and loads JSON from AI response, handling markdown code blocks and fallback logic."""
         try:
-            resp = resp.strip()
-
-
             # STEP 1: Remove triple backtick wrappers like ```json ... ```
-            if resp.startswith("```json"):
-                resp = resp.replace("```json", "").strip()
-            elif resp.startswith("```"):
-                resp = resp.replace("```", "").strip()
-
-            # Remove trailing backticks if they exist
-            if resp.endswith("```"):
-                resp = resp[:-3].strip()
+            resp = resp.strip().removeprefix("```json").removeprefix("```").removesuffix("```").strip()
 
             # Optional: see what was cleaned
             print("[FINAL CLEANED RESPONSE]", repr(resp))
 
-            # STEP 2: Extract JSON object using regex
-            json_match = re.search(r'\{.*?\}', resp, re.DOTALL)
-            if not json_match:
+            # STEP 2: Extract the first balanced JSON object
+            raw_json = find_json_object(resp)
+            if raw_json is None:
                 raise ValueError("No JSON found in model response")
 
-            raw_json = json_match.group(0)
-            parsed = json.loads(raw_json)
-
-            # STEP 3: Ensure expected keys are present
-            for key in ["task_name", "action", "requires_admin"]:
-                if key not in parsed:
-                    raise KeyError(f"Missing key: '{key}'")
-
-            return parsed
+            # STEP 3: Parse, ensuring expected keys are present
+            return parse_task_json(raw_json)
 
         except Exception as e:
-            self.chat_area.insert(tk.END, f"\n[DEBUG] Raw Response Error: {e}\n{resp}\n\n")
+            out = [f"\n[DEBUG] Raw Response Error: {e}\n{resp}\n\n"]
             self._log_message("AI Response Failure", f"{e} - Raw: {resp}")
 
             # STEP 4: Handle fallback behavior
-            fallback_msg = identity.get("fallback_behavior", {}).get("on_no_match")
-            if fallback_msg:
-                self.chat_area.insert(tk.END, f"AI: {fallback_msg}\n\n")
+            if self._fallback_msg:
+                out.append(f"AI: {self._fallback_msg}\n\n")
+                self._append_chat(out)
                 return None
 
+            # Flush before handing off, so the debug text precedes the task output.
+            self._append_chat(out)
             fallback = find_best_local_match(user_req, load_config("task_intents.json"))
             if fallback:
                 self._handle_matched_task({
@@ -853,24 +1134,33 @@ class App(tk.Tk):
         log_to_file(full_message)
 
 
+_BOOT_TIME = None  # fixed for the life of the boot; read once on first use
+
+@functools.lru_cache(maxsize=1)
+def _format_uptime(uptime_seconds):
+    """Formats whole seconds of uptime; cached so repeat calls within a second are free."""
+    days, rem = divmod(uptime_seconds, 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes, seconds = divmod(rem, 60)
+
+    uptime_str = ""
+    if days:
+        uptime_str += f"{days} day(s), "
+    if hours:
+        uptime_str += f"{hours} hour(s), "
+    if minutes:
+        uptime_str += f"{minutes} minute(s), "
+    uptime_str += f"{seconds} second(s)"
+
+    return uptime_str.strip(", ")  # Remove trailing comma if present
+
 def get_system_uptime():
     """Retrieves system uptime and formats it into a human-readable string."""
+    global _BOOT_TIME
     try:
-        uptime_seconds = time.time() - psutil.boot_time()
-        days, rem = divmod(uptime_seconds, 86400)
-        hours, rem = divmod(rem, 3600)
-        minutes, seconds = divmod(rem, 60)
-
-        uptime_str = ""
-        if days:
-            uptime_str += f"{int(days)} day(s), "
-        if hours:
-            uptime_str += f"{int(hours)} hour(s), "
-        if minutes:
-            uptime_str += f"{int(minutes)} minute(s), "
-        uptime_str += f"{int(seconds)} second(s)"
-
-        return uptime_str.strip(", ")  # Remove trailing comma if present
+        if _BOOT_TIME is None:
+            _BOOT_TIME = psutil.boot_time()
+        return _format_uptime(int(time.time() - _BOOT_TIME))
     except Exception as e:
         return f"Could not retrieve uptime: {e}"
 
@@ -878,3 +1168,5 @@ if __name__ == "__main__":
     app = App() # build GUI widgets first
     app.run_startup_tasks() # prompt login and launch
     app.mainloop() # build GUI widgets first
+    app.flush_policy()
+    stop_speaking()
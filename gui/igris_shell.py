@@ -1,15 +1,37 @@
 import tkinter as tk
+import ast
 import json
+import os
+import sys
+import io
 import time
 import subprocess
 import threading
+import contextlib
+import tempfile
+import importlib.util
+import multiprocessing
+from collections import deque
+import hmac
+import secrets
+import socket
+import socketserver
+import struct
 from pathlib import Path
 
 # A.1: Add imports and a simple registry of actions
-import re
-import speech_recognition as sr
+# speech_recognition is heavy; it is imported after the first paint (see _init_voice_input).
+sr = None
 from tkinter import ttk, font as tkfont
 
+try:
+    # Optional: file-change notifications for the command queue
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
 # This registry maps human-readable names to internal command actions.
 # It will power the command palette.
 SHELL_COMMANDS = {
@@ -27,8 +49,230 @@ SHELL_COMMANDS = {
 ROOT = Path(__file__).resolve().parent.parent
 CONFIG_DIR = ROOT / "ai_assistant_config"
 CONFIG_DIR = ROOT / "ai_assistant_config"
+# Producers must replace this file atomically (write a temp file in CONFIG_DIR,
+# then os.replace) so the shell never reads a half-written queue.
 COMMAND_QUEUE_FILE = CONFIG_DIR / "desktop_command_queue.json"
-COMMAND_QUEUE_LOCK = threading.Lock()
+COMMAND_SOCKET_PATH = CONFIG_DIR / "igris.sock"
+COMMAND_TCP_ADDR = ("127.0.0.1", 48613)  # loopback fallback where AF_UNIX is unavailable
+# Per-run shared secret for the command socket; only readable by the user running the shell
+COMMAND_TOKEN_FILE = CONFIG_DIR / "igris_ipc.token"
+MAX_FRAME = 8192               # bytes; a command frame is a small JSON object
+PLUGINS_DIR = ROOT / "plugins"
+PLUGIN_WORKERS = 2
+PLUGIN_TIMEOUT = 60            # seconds a plugin may run before it is stopped
+PLUGIN_TIMEOUT_GRACE = 5       # lets the script path's own timeout report first
+QUEUE_POLL_MS = 1000           # initial polling interval
+QUEUE_BUSY_POLL_MS = 100       # right after a dispatch, more commands are likely
+QUEUE_IDLE_BASE_MS = 500       # empty polls back off from here, doubling each time...
+QUEUE_MAX_POLL_MS = 30000      # ...up to this cap
+QUEUE_SAFETY_POLL_MS = 5000    # floor while watchdog notifications are active
+
+
+def write_queue_atomic(queue):
+    """Replaces the command queue file in one step via a temp file and os.replace."""
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=CONFIG_DIR,
+                                     suffix=".tmp", delete=False) as tmp:
+        json.dump(queue, tmp)
+    os.replace(tmp.name, COMMAND_QUEUE_FILE)
+
+
+def format_command(command_data):
+    """Turns a queued {"action", "params"} record into a dispatchable command string."""
+    action = command_data.get("action", "")
+    params = command_data.get("params", {})
+    # A simple way to pass params for now
+    param_str = " ".join([f"{k}={v}" for k, v in params.items()])
+    return f"{action} {param_str}".strip()
+
+
+# --- Plugin worker processes ---
+# Workers stay alive between calls, so each plugin is imported at most once per
+# worker instead of paying interpreter start-up on every dispatch. Each worker
+# has its own pipe, so a hung plugin can be killed without touching the others.
+_loaded_plugins = {}  # plugin name -> ((mtime_ns, size), module)
+
+
+def _init_plugin_worker(root_dir):
+    """Gives a worker the same cwd and import path a plugin subprocess would have."""
+    os.chdir(root_dir)
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+
+def _defines_run(script_path):
+    """True if the plugin defines a top-level ``run()`` function."""
+    try:
+        tree = ast.parse(script_path.read_bytes(), filename=str(script_path))
+    except (SyntaxError, ValueError):
+        return False  # the script path reports the error
+    return any(isinstance(node, ast.FunctionDef) and node.name == "run" for node in tree.body)
+
+
+def _run_named(plugin_name):
+    """
+    Runs a plugin inside a pool worker and returns the feedback text.
+    Plugins exposing ``run()`` are imported once and called directly; anything
+    else is executed as a standalone script, as before.
+    """
+    script_path = PLUGINS_DIR / f"{plugin_name}.py"
+    st = script_path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _loaded_plugins.get(plugin_name)
+    module = cached[1] if cached and cached[0] == stamp else None  # re-import edited plugins
+    if module is None and _defines_run(script_path):
+        # Only import plugins with a run() entry point; importing a script-style
+        # plugin would execute its top-level code a second time.
+        spec = importlib.util.spec_from_file_location(f"plugins.{plugin_name}", script_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _loaded_plugins[plugin_name] = (stamp, module)
+
+    if module is None or not callable(getattr(module, "run", None)):
+        result = subprocess.run(
+            [sys.executable, str(script_path)],
+            capture_output=True,
+            text=True,
+            cwd=str(ROOT),
+            timeout=PLUGIN_TIMEOUT
+        )
+        if result.returncode != 0:
+            error_output = result.stderr.strip() or "Unknown error"
+            return f"[Plugin Error] {plugin_name} failed:\n{error_output}"
+        output = result.stdout.strip()
+    else:
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            returned = module.run()
+        output = "\n".join(part for part in (stdout.getvalue().strip(), str(returned or "").strip()) if part)
+
+    display_output = output if output else "No output returned."
+    return f"[Plugin Output]\n{display_output}"
+
+
+def _write_ipc_token():
+    """Creates a fresh socket token; NamedTemporaryFile files are created mode 0600."""
+    token = secrets.token_hex(32)
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=CONFIG_DIR,
+                                     suffix=".tmp", delete=False) as tmp:
+        tmp.write(token)
+    os.replace(tmp.name, COMMAND_TOKEN_FILE)
+    return token
+
+
+def _plugin_worker_main(conn, root_dir):
+    """Worker loop: runs one plugin name per message until the pipe closes."""
+    _init_plugin_worker(root_dir)
+    while True:
+        try:
+            plugin_name = conn.recv()
+        except EOFError:
+            return
+        if plugin_name is None:
+            return
+        try:
+            reply = (True, _run_named(plugin_name))
+        except Exception as e:
+            reply = (False, str(e))
+        conn.send(reply)
+
+
+class _PluginWorker:
+    """A spawned plugin worker process and the task it is currently running."""
+
+    def __init__(self, ctx):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_plugin_worker_main, args=(child_conn, ROOT), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.seq = 0              # bumped per task so stale timers and replies can be told apart
+        self.plugin_name = None   # set while a task is running
+        self._reader = None
+
+    def submit(self, plugin_name, on_reply):
+        """Sends one plugin to the worker; on_reply(seq, reply) is called from a reader thread."""
+        self.seq += 1
+        self.plugin_name = plugin_name
+        seq = self.seq
+        self.conn.send(plugin_name)
+
+        def wait_for_reply():
+            try:
+                reply = self.conn.recv()
+            except (EOFError, OSError):
+                reply = None  # worker exited or was stopped
+                self.conn.close()
+            on_reply(seq, reply)
+
+        self._reader = threading.Thread(target=wait_for_reply, daemon=True)
+        self._reader.start()
+        return seq
+
+    def stop(self):
+        self.process.terminate()
+        if self._reader is None or not self._reader.is_alive():
+            self.conn.close()  # otherwise the reader closes it once recv() fails
+
+
+def send_shell_command(action, params=None, timeout=2.0):
+    """
+    Sends one command to a running shell over its local socket.
+    Frames are a 4-byte big-endian length followed by that many bytes of JSON;
+    each frame carries the token the shell wrote to COMMAND_TOKEN_FILE.
+    Raises OSError if no shell is listening, ValueError if the frame exceeds MAX_FRAME.
+    """
+    token = COMMAND_TOKEN_FILE.read_text(encoding="utf-8").strip()
+    payload = json.dumps({"token": token, "action": action, "params": params or {}}).encode("utf-8")
+    if len(payload) > MAX_FRAME:
+        raise ValueError(f"command frame is {len(payload)} bytes; the limit is {MAX_FRAME}")
+    if hasattr(socket, "AF_UNIX"):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        address = str(COMMAND_SOCKET_PATH)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        address = COMMAND_TCP_ADDR
+    with sock:
+        sock.settimeout(timeout)
+        sock.connect(address)
+        sock.sendall(struct.pack(">I", len(payload)) + payload)
+
+
+class _CommandRequestHandler(socketserver.StreamRequestHandler):
+    """Reads length-prefixed JSON frames and hands them to the Tk thread."""
+    def handle(self):
+        shell = self.server.shell
+        while True:
+            header = self.rfile.read(4)
+            if len(header) < 4:
+                return
+            (length,) = struct.unpack(">I", header)
+            if length > MAX_FRAME:
+                # Checked before reading so an unauthenticated peer can't force a huge allocation
+                print(f"Rejected oversized socket command ({length} bytes).")
+                return
+            payload = self.rfile.read(length)
+            if len(payload) < length:
+                return
+            try:
+                command_data = json.loads(payload)
+            except json.JSONDecodeError as e:
+                print(f"Error decoding socket command: {e}")
+                continue
+            token = command_data.get("token") if isinstance(command_data, dict) else None
+            if not isinstance(token, str) or not hmac.compare_digest(token, self.server.token):
+                print("Rejected socket command with a missing or invalid token.")
+                return
+            shell.root.after(0, shell.dispatch_command, format_command(command_data))
+
+
+class _CommandQueueHandler(FileSystemEventHandler):
+    """Wakes the shell when the command queue file is written or replaced."""
+    def __init__(self, shell):
+        self.shell = shell
+
+    def on_any_event(self, event):
+        paths = (event.src_path, getattr(event, "dest_path", ""))
+        if any(Path(p).name == COMMAND_QUEUE_FILE.name for p in paths if p):
+            self.shell.root.after(0, self.shell._drain_queue)
 
 class IgrisShell:
     def __init__(self, root):
@@ -47,23 +291,38 @@ class IgrisShell:
             bg="#1e1e1e"
         ).pack(pady=50)
 
+        # A single scrolling log replaces the per-message Labels, which piled up
+        # in the widget tree and made every layout pass slower.
+        self.log = tk.Text(
+            self.root,
+            height=10,
+            bg="#1e1e1e",
+            fg="white",
+            font=("Consolas", 10),
+            relief=tk.FLAT,
+            wrap=tk.WORD,
+            state="disabled"
+        )
+        self.log.tag_configure("feedback", foreground="lightblue")
+        self.log.pack(side=tk.BOTTOM, fill=tk.BOTH, expand=True, padx=10, pady=(2, 10))
+        self._feedback_seq = 0
+
         # A.2: Inside IgrisShell.__init__, add hotkeys and a help overlay
         # --- Command Palette & Hotkeys ---
         self.command_palette_visible = False
         self.actions = SHELL_COMMANDS
+        self._actions_sorted = sorted(self.actions.keys())
+        self._actions_lower = [(name.lower(), name) for name in self._actions_sorted]
+        self._palette_idle_id = None
+        self._pending_palette_items = None
+        self._last_palette_items = None
         self.root.bind_all("<Control-space>", self.show_command_palette)
         self.root.bind_all("<F1>", self.toggle_help_overlay)
         self.root.bind_all("<Control-grave>", lambda e: self.dispatch_command("window:fullscreen"))
 
         # --- Voice Input ---
-        if sr is not None:
-            try:
-                self.recognizer = sr.Recognizer()
-                self.microphone = sr.Microphone()
-                self.adjust_for_ambient_noise()
-            except Exception as e:
-                print(f"Error initializing voice recognition: {e}")
-                self.recognizer = self.microphone = None
+        self.recognizer = self.microphone = None
+        self.root.after_idle(self._init_voice_input)
 
         # --- Help Overlay ---
         self.help_overlay = tk.Frame(self.root, bg="black", highlightbackground="grey", highlightthickness=1)
@@ -90,29 +349,105 @@ Ctrl+`       -  Toggle Fullscreen
         # --- Fullscreen state ---
         self._is_fullscreen = False
 
-        # --- IPC command queue poller ---
+        # --- IPC command queue watcher/poller ---
+        self._queue_stamp = None
+        self._poll_interval_ms = QUEUE_POLL_MS
+        self._empty_polls = 0
+        self._queue_observer = None
+        if Observer is not None:
+            try:
+                self._queue_observer = Observer()
+                self._queue_observer.schedule(_CommandQueueHandler(self), str(CONFIG_DIR), recursive=False)
+                self._queue_observer.daemon = True
+                self._queue_observer.start()
+            except Exception as e:
+                print(f"Error starting command queue watcher: {e}")
+                self._queue_observer = None
         self.poll_command_queue()
 
+        self._plugin_ctx = multiprocessing.get_context("spawn")
+        self._plugin_workers = []        # started on demand, up to PLUGIN_WORKERS
+        self._pending_plugins = deque()  # plugin names waiting for an idle worker
+
+        # --- IPC socket server (preferred channel; the file queue stays for existing producers) ---
+        self._ipc_server = self._start_ipc_server()
+
+    def _start_ipc_server(self):
+        """Serves length-prefixed JSON commands on a local socket from a background thread."""
+        try:
+            token = _write_ipc_token()
+            if hasattr(socketserver, "ThreadingUnixStreamServer"):
+                if COMMAND_SOCKET_PATH.exists():
+                    COMMAND_SOCKET_PATH.unlink()  # stale socket from a previous run
+                server = socketserver.ThreadingUnixStreamServer(str(COMMAND_SOCKET_PATH), _CommandRequestHandler)
+                os.chmod(COMMAND_SOCKET_PATH, 0o600)
+            else:
+                server = socketserver.ThreadingTCPServer(COMMAND_TCP_ADDR, _CommandRequestHandler)
+        except OSError as e:
+            print(f"Error starting command socket: {e}")
+            return None
+        server.daemon_threads = True
+        server.shell = self
+        server.token = token
+        threading.Thread(target=server.serve_forever, name="igris-ipc", daemon=True).start()
+        return server
+
+    def _init_voice_input(self):
+        """Imports speech_recognition and sets up the microphone once the shell is on screen."""
+        global sr
+        try:
+            import speech_recognition as sr
+        except ImportError:
+            return
+        try:
+            self.recognizer = sr.Recognizer()
+            self.microphone = sr.Microphone()
+            self.adjust_for_ambient_noise()
+        except Exception as e:
+            print(f"Error initializing voice recognition: {e}")
+            self.recognizer = self.microphone = None
+
     def poll_command_queue(self):
-        """Periodically check the command queue file for new commands."""
-        with COMMAND_QUEUE_LOCK:
-            if COMMAND_QUEUE_FILE.exists():
-                try:
-                    queue = json.loads(COMMAND_QUEUE_FILE.read_text(encoding="utf-8"))
-                    if queue:
-                        for command_data in queue:
-                            action = command_data.get("action", "")
-                            params = command_data.get("params", {})
-                            # A simple way to pass params for now
-                            param_str = " ".join([f"{k}={v}" for k, v in params.items()])
-                            full_command = f"{action} {param_str}".strip()
-                            self.dispatch_command(full_command)
-                        # Clear the queue after processing
-                        COMMAND_QUEUE_FILE.write_text("[]", encoding="utf-8")
-                except (json.JSONDecodeError, IOError) as e:
-                    print(f"Error processing command queue: {e}")
-        # Poll again after 1 second
-        self.root.after(1000, self.poll_command_queue)
+        """Periodically check the command queue file, backing off while it stays empty."""
+        if self._drain_queue():
+            self._empty_polls = 0
+            self._poll_interval_ms = QUEUE_BUSY_POLL_MS
+        else:
+            self._empty_polls += 1
+            interval = QUEUE_IDLE_BASE_MS * (2 ** min(self._empty_polls, 6))
+            if self._queue_observer:
+                # With file notifications active this is only a safety net
+                interval = max(interval, QUEUE_SAFETY_POLL_MS)
+            self._poll_interval_ms = min(QUEUE_MAX_POLL_MS, interval)
+        self.root.after(self._poll_interval_ms, self.poll_command_queue)
+
+    def _drain_queue(self):
+        """
+        Dispatches queued commands if the queue file changed since the last drain.
+        Returns True if any command was dispatched.
+        """
+        try:
+            st = COMMAND_QUEUE_FILE.stat()
+        except FileNotFoundError:
+            return False
+        if (st.st_mtime_ns, st.st_size) == self._queue_stamp:
+            return False
+        dispatched = False
+        # Only ever called on the Tk thread, so no in-process lock is needed;
+        # cross-process safety comes from the atomic replace.
+        try:
+            queue = json.loads(COMMAND_QUEUE_FILE.read_text(encoding="utf-8"))
+            if queue:
+                for command_data in queue:
+                    self.dispatch_command(format_command(command_data))
+                dispatched = True
+                # Clear the queue after processing
+                write_queue_atomic([])
+            st = COMMAND_QUEUE_FILE.stat()
+            self._queue_stamp = (st.st_mtime_ns, st.st_size)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error processing command queue: {e}")
+        return dispatched
 
     def dispatch_command(self, command_action):
         """Handles commands from the queue and the command palette."""
@@ -140,92 +475,120 @@ Ctrl+`       -  Toggle Fullscreen
 
     def handle_widget_command(self, command_action):
             print("Widget Command: ", command_action)
-            tk.Label(self.root, text=f"Widget Command: {command_action}", fg="white", bg="#1e1e1e").pack()
+            self.append_log(f"Widget Command: {command_action}")
 
     def handle_app_command(self, command_action):
             print("App Command: ", command_action)
 
-            tk.Label(self.root, text=f"Executed: {command_action}", fg="white", bg="#1e1e1e").pack()
+            self.append_log(f"Executed: {command_action}")
+
+    def append_log(self, text, *tags):
+        """Appends one line to the shell log and scrolls it into view."""
+        self.log.configure(state="normal")
+        self.log.insert(tk.END, f"{text}\n", tags)
+        self.log.configure(state="disabled")
+        self.log.see(tk.END)
 
     def run_plugin_action(self, action):
         """
         Executes a plugin command specified as ``plugin:<plugin_name>``.
 
         The plugin should be a Python file located in the ``plugins``
-        directory under the Igris project root. The plugin will be
-        executed in a subprocess using the current Python interpreter.
+        directory under the Igris project root. It runs in a pooled
+        worker process (see ``_run_named``) so the shell stays responsive.
 
-        On success, the plugin's standard output will be displayed in the
-        shell. On failure or if the plugin is not found, an error
-        message will be shown via ``show_feedback``.
+        On completion, the plugin's output or error will be displayed in
+        the shell via ``show_feedback``.
         """
-        import subprocess
-        import sys
-        import shlex
-
         # Remove the "plugin:" prefix and strip whitespace
         plugin_name = action.replace("plugin:", "", 1).strip()
-        # Determine the root directory of the project. This file lives in
-        # ``gui`` or ``shell``; the root is two directories up.
-        ROOT_DIR = Path(__file__).resolve().parent.parent
-        script_path = ROOT_DIR / "plugins" / f"{plugin_name}.py"
+        script_path = PLUGINS_DIR / f"{plugin_name}.py"
 
         # If the plugin does not exist, show an error
         if not script_path.exists():
             self.show_feedback(f"[Plugin Error] {plugin_name}.py not found.")
             return
 
-        # Build the subprocess call. Use sys.executable to ensure the
-        # same Python interpreter executes the plugin.
-        cmd = [sys.executable, str(script_path)]
+        self._pending_plugins.append(plugin_name)
+        self._dispatch_pending_plugins()
 
-        try:
-            # Run the plugin with a timeout. Capture both stdout and
-            # stderr so we can surface errors if they occur. A 60s
-            # timeout prevents hanging indefinitely.
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=str(ROOT_DIR),
-                timeout=60
-            )
-            output = result.stdout.strip()
-            if result.returncode != 0:
-                # If the plugin exited with a non-zero code, surface the
-                # error output.
-                error_output = result.stderr.strip() or "Unknown error"
-                self.show_feedback(f"[Plugin Error] {plugin_name} failed:\n{error_output}")
-            else:
-                # On success, display the output or a message if none
-                display_output = output if output else "No output returned."
-                self.show_feedback(f"[Plugin Output]\n{display_output}")
-        except Exception as e:
-            # Catch and display any unexpected runtime errors
-            self.show_feedback(f"[Runtime Error] {e}")
+    def _dispatch_pending_plugins(self):
+        """Hands queued plugins to idle workers, starting workers as needed."""
+        while self._pending_plugins:
+            worker = next((w for w in self._plugin_workers if w.plugin_name is None), None)
+            if worker is None:
+                if len(self._plugin_workers) >= PLUGIN_WORKERS:
+                    return
+                try:
+                    worker = _PluginWorker(self._plugin_ctx)
+                except OSError as e:
+                    self._pending_plugins.clear()
+                    self.show_feedback(f"[Runtime Error] {e}")
+                    return
+                self._plugin_workers.append(worker)
+            plugin_name = self._pending_plugins.popleft()
+            try:
+                seq = worker.submit(plugin_name, lambda seq, reply, w=worker: self.root.after(
+                    0, self._finish_plugin, w, seq, reply))
+            except OSError as e:
+                self._retire_worker(worker)
+                self.show_feedback(f"[Runtime Error] {e}")
+                continue
+            # The clock starts now that the plugin is actually running
+            self.root.after((PLUGIN_TIMEOUT + PLUGIN_TIMEOUT_GRACE) * 1000,
+                            self._check_plugin_timeout, worker, seq)
+
+    def _retire_worker(self, worker):
+        worker.stop()
+        if worker in self._plugin_workers:
+            self._plugin_workers.remove(worker)
+
+    def _check_plugin_timeout(self, worker, seq):
+        """Stops the worker running a plugin that has run for too long."""
+        if worker.seq != seq or worker.plugin_name is None:
+            return  # that task already finished
+        plugin_name = worker.plugin_name
+        worker.plugin_name = None
+        self._retire_worker(worker)  # only this worker; other running plugins are unaffected
+        self.show_feedback(f"[Plugin Error] {plugin_name} timed out after {PLUGIN_TIMEOUT}s and was stopped.")
+        self._dispatch_pending_plugins()
+
+    def _finish_plugin(self, worker, seq, reply):
+        """Shows a plugin result on the Tk thread."""
+        if worker.seq != seq or worker.plugin_name is None:
+            return  # already reported by _check_plugin_timeout
+        plugin_name = worker.plugin_name
+        worker.plugin_name = None
+        if reply is None:
+            self._retire_worker(worker)
+            self.show_feedback(f"[Runtime Error] plugin worker for {plugin_name} exited unexpectedly.")
+        else:
+            ok, message = reply
+            self.show_feedback(message if ok else f"[Runtime Error] {message}")
+        self._dispatch_pending_plugins()
 
     def show_feedback(self, message):
         """
         Display a feedback message in the shell UI. The message
-        appears as a transient label that auto-dismisses after a
+        is appended to the shell log and removed again after a
         short duration. This method ensures consistent styling and
         centralized message handling.
         """
-        # Create a label to hold the feedback message
-        label = tk.Label(
-            self.root,
-            text=message,
-            justify="left",
-            anchor="w",
-            fg="lightblue",
-            bg="#1e1e1e",
-            font=("Consolas", 10)
-        )
-        # Pack it at the top of the window so it appears underneath
-        # any existing content
-        label.pack(fill=tk.X, padx=10, pady=(2, 2))
-        # Schedule it to be destroyed after 10 seconds
-        self.root.after(10000, label.destroy)
+        # Each message gets its own tag so it can be found and removed later
+        self._feedback_seq += 1
+        tag = f"feedback-{self._feedback_seq}"
+        self.append_log(message, "feedback", tag)
+        # Schedule it to be removed after 10 seconds
+        self.root.after(10000, self._expire_feedback, tag)
+
+    def _expire_feedback(self, tag):
+        """Deletes a feedback message from the log once it has timed out."""
+        ranges = self.log.tag_ranges(tag)
+        if ranges:
+            self.log.configure(state="normal")
+            self.log.delete(ranges[0], ranges[-1])
+            self.log.configure(state="disabled")
+        self.log.tag_delete(tag)
 
     def toggle_fullscreen(self, event=None):
         self._is_fullscreen = not self._is_fullscreen
@@ -273,6 +636,7 @@ Ctrl+`       -  Toggle Fullscreen
         self.palette_listbox = tk.Listbox(self.palette, bg="#222", fg="white", selectbackground="#0078D7",
                                           highlightthickness=0, borderwidth=0, font=("Segoe UI", 10), activestyle='none')
         self.palette_listbox.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._last_palette_items = None  # fresh listbox
         self.populate_palette_listbox()
 
         # --- Bindings ---
@@ -291,15 +655,36 @@ Ctrl+`       -  Toggle Fullscreen
         self.command_palette_visible = False
 
     def populate_palette_listbox(self, items=None):
-        """Clears and populates the listbox with a given set of items."""
-        self.palette_listbox.delete(0, tk.END)
+        """
+        Schedules the listbox to show the given items. Repeated calls before
+        Tk goes idle (e.g. a burst of keystrokes) collapse into one redraw.
+        """
+        self._pending_palette_items = items
+        if self._palette_idle_id is None:
+            self._palette_idle_id = self.root.after_idle(self._populate_now)
+
+    def _populate_now(self):
+        """Clears and populates the listbox, skipping the work if nothing changed."""
+        self._palette_idle_id = None
+        if not self.command_palette_visible:
+            return
+        items = self._pending_palette_items
         if items is None:
-            items = sorted(self.actions.keys())
-        for item in items:
-            self.palette_listbox.insert(tk.END, item)
-        if self.palette_listbox.size() > 0:
+            items = self._actions_sorted
+        if items == self._last_palette_items:
+            return
+        self._last_palette_items = items
+        self.palette_listbox.delete(0, tk.END)
+        if items:
+            self.palette_listbox.insert(tk.END, *items)
             self.palette_listbox.selection_set(0)
 
+    def _flush_palette(self):
+        """Applies a pending listbox update immediately (before reading the selection)."""
+        if self._palette_idle_id is not None:
+            self.root.after_cancel(self._palette_idle_id)
+            self._populate_now()
+
     def filter_palette(self, *args):
         """Filters the command palette listbox based on user input."""
         query = self.palette_entry_var.get().lower()
@@ -307,14 +692,13 @@ Ctrl+`       -  Toggle Fullscreen
             self.populate_palette_listbox()
             return
         
-        filtered_items = [
-            name for name in self.actions
-            if re.search(query, name, re.IGNORECASE)
-        ]
-        self.populate_palette_listbox(sorted(filtered_items))
+        # _actions_lower is already sorted, so the filtered list needs no re-sort.
+        filtered_items = [name for lower, name in self._actions_lower if query in lower]
+        self.populate_palette_listbox(filtered_items)
 
     def navigate_palette(self, direction):
         """Handles up/down arrow navigation in the command palette."""
+        self._flush_palette()
         if not self.palette_listbox.size():
             return
         current_selection = self.palette_listbox.curselection()
@@ -329,6 +713,7 @@ Ctrl+`       -  Toggle Fullscreen
 
     def execute_palette_selection(self, event=None):
         """Executes the selected command from the palette."""
+        self._flush_palette()
         selection_indices = self.palette_listbox.curselection()
         if not selection_indices:
             return
@@ -341,6 +726,18 @@ Ctrl+`       -  Toggle Fullscreen
         
 
     def quit_shell(self):
+        if self._queue_observer is not None:
+            self._queue_observer.stop()
+        if self._ipc_server is not None:
+            self._ipc_server.shutdown()
+            self._ipc_server.server_close()
+            if hasattr(socketserver, "ThreadingUnixStreamServer") and COMMAND_SOCKET_PATH.exists():
+                COMMAND_SOCKET_PATH.unlink()
+            COMMAND_TOKEN_FILE.unlink(missing_ok=True)
+        self._pending_plugins.clear()
+        for worker in self._plugin_workers:
+            worker.stop()
+        self._plugin_workers.clear()
         self.root.quit()
         self.hide_command_palette()
 
@@ -2,8 +2,24 @@
 A Tkinter widget to display network status using psutil.
 """
 import tkinter as tk
-import psutil
 import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# The primary interface rarely changes, so it is resolved off the Tk thread
+# and reused for this many seconds.
+IFACE_REFRESH_SECONDS = 60
+_IFACE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="netstats")
+
+psutil = None  # imported on first use; see _load_psutil()
+
+def _load_psutil():
+    """Imports psutil the first time a widget needs it and caches the module."""
+    global psutil
+    if psutil is None:
+        import psutil as _psutil
+        psutil = _psutil
+    return psutil
 
 class NetworkStatsWidget(tk.Frame):
     """
@@ -13,22 +29,56 @@ class NetworkStatsWidget(tk.Frame):
         super().__init__(parent, *args, bg="#222", **kwargs)
         self.config(borderwidth=1, relief=tk.SOLID)
 
-        self.interface_label = tk.Label(self, text="Interface: N/A", fg="white", bg="#222", font=("Segoe UI", 10))
+        self.iface_var = tk.StringVar(self, value="Interface: N/A")
+        self.ip_var = tk.StringVar(self, value="IP: N/A")
+        self.sent_var = tk.StringVar(self, value="Sent: 0.0 MB")
+        self.recv_var = tk.StringVar(self, value="Recv: 0.0 MB")
+
+        self.interface_label = tk.Label(self, textvariable=self.iface_var, fg="white", bg="#222", font=("Segoe UI", 10))
         self.interface_label.pack(pady=(5, 2), padx=10, anchor=tk.W)
 
-        self.ip_label = tk.Label(self, text="IP: N/A", fg="white", bg="#222", font=("Segoe UI", 10))
+        self.ip_label = tk.Label(self, textvariable=self.ip_var, fg="white", bg="#222", font=("Segoe UI", 10))
         self.ip_label.pack(pady=2, padx=10, anchor=tk.W)
 
-        self.sent_label = tk.Label(self, text="Sent: 0.0 MB", fg="white", bg="#222", font=("Segoe UI", 10))
+        self.sent_label = tk.Label(self, textvariable=self.sent_var, fg="white", bg="#222", font=("Segoe UI", 10))
         self.sent_label.pack(pady=2, padx=10, anchor=tk.W)
 
-        self.recv_label = tk.Label(self, text="Recv: 0.0 MB", fg="white", bg="#222", font=("Segoe UI", 10))
+        self.recv_label = tk.Label(self, textvariable=self.recv_var, fg="white", bg="#222", font=("Segoe UI", 10))
         self.recv_label.pack(pady=(2, 5), padx=10, anchor=tk.W)
 
+        self._iface_cache = ("N/A", "N/A")
+        self._iface_cache_ts = float("-inf")
+        self._iface_future = None
+        self._var_text = {}
+        self._last_io = _load_psutil().net_io_counters(pernic=False)
+        self._last_io_ts = time.monotonic()
+        self.bind("<Double-Button-1>", self.refresh_default_route)
+
         self.update_stats()
 
     def get_primary_interface_info(self):
         """Finds the most likely primary network interface and its IPv4 address."""
+        # Pure kernel lookups, no network I/O: pick the fastest interface that is
+        # up, is not loopback, and has an IPv4 address.
+        try:
+            addrs = psutil.net_if_addrs()
+            best = None
+            for intf, stats in psutil.net_if_stats().items():
+                if not stats.isup:
+                    continue
+                ip = next((a.address for a in addrs.get(intf, ()) if a.family == socket.AF_INET), None)
+                if ip is None or ip.startswith("127."):
+                    continue
+                if best is None or stats.speed > best[0]:
+                    best = (stats.speed, intf, ip)
+            if best:
+                return best[1], best[2]
+        except OSError:
+            pass
+        return "N/A", "N/A"
+
+    def get_default_route_interface_info(self):
+        """Finds the interface used to reach an external address (may block up to 1s)."""
         try:
             # A common method is to check which interface is used to connect to an external address.
             with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
@@ -46,18 +96,54 @@ class NetworkStatsWidget(tk.Frame):
             pass
         return "N/A", "N/A"
 
+    def refresh_default_route(self, event=None):
+        """User-triggered refresh that resolves the interface via the default route."""
+        if self._iface_future is None:
+            self._iface_future = _IFACE_POOL.submit(self.get_default_route_interface_info)
+
+    def _refresh_interface(self):
+        """Collects a finished lookup and starts a new one once the cache is stale."""
+        future = self._iface_future
+        if future is not None and future.done():
+            self._iface_future = None
+            try:
+                self._iface_cache = future.result()
+            except Exception:
+                self._iface_cache = ("N/A", "N/A")
+            self._iface_cache_ts = time.monotonic()
+        if self._iface_future is None and time.monotonic() - self._iface_cache_ts >= IFACE_REFRESH_SECONDS:
+            self._iface_future = _IFACE_POOL.submit(self.get_primary_interface_info)
+        return self._iface_cache
+
+    def _set_var(self, var, text):
+        """Sets a label's StringVar only when the displayed text actually changes."""
+        # Keyed by the Tcl variable name: tkinter.Variable defines __eq__ but not __hash__
+        name = str(var)
+        if self._var_text.get(name) != text:
+            var.set(text)
+            self._var_text[name] = text
+
     def update_stats(self):
         """Updates the network statistics display."""
+        # Hidden widgets don't need fresh numbers; the next visible tick catches up.
+        if not self.winfo_viewable():
+            self.after(2000, self.update_stats)
+            return
         try:
-            interface_name, ip_address = self.get_primary_interface_info()
-            net_io = psutil.net_io_counters()
+            interface_name, ip_address = self._refresh_interface()
+            net_io = psutil.net_io_counters(pernic=False)
+            now = time.monotonic()
+            dt = max(now - self._last_io_ts, 1e-6)
+            sent_rate = (net_io.bytes_sent - self._last_io.bytes_sent) / dt / (1024*1024)
+            recv_rate = (net_io.bytes_recv - self._last_io.bytes_recv) / dt / (1024*1024)
+            self._last_io, self._last_io_ts = net_io, now
 
-            self.interface_label.config(text=f"Interface: {interface_name}")
-            self.ip_label.config(text=f"IP: {ip_address}")
-            self.sent_label.config(text=f"Sent: {net_io.bytes_sent / (1024*1024):.2f} MB")
-            self.recv_label.config(text=f"Recv: {net_io.bytes_recv / (1024*1024):.2f} MB")
+            self._set_var(self.iface_var, f"Interface: {interface_name}")
+            self._set_var(self.ip_var, f"IP: {ip_address}")
+            self._set_var(self.sent_var, f"Sent: {net_io.bytes_sent / (1024*1024):.2f} MB ({sent_rate:.2f} MB/s)")
+            self._set_var(self.recv_var, f"Recv: {net_io.bytes_recv / (1024*1024):.2f} MB ({recv_rate:.2f} MB/s)")
         except Exception as e:
-            self.ip_label.config(text=f"Error: {type(e).__name__}")
+            self._set_var(self.ip_var, f"Error: {type(e).__name__}")
 
         # Schedule the next update
         self.after(2000, self.update_stats)
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""
+Shared Tools → Run Plugin menu patch used by the phase 1 finalizer plugins.
+"""
+
+import threading
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+
+def show_plugin_menu_patch(self):
+    plugins = self.load_plugins()
+    if not plugins:
+        messagebox.showinfo("Plugins", "No plugins found in the plugins directory.")
+        return
+
+    top = tk.Toplevel(self)
+    top.title("Run Plugin")
+    tree = ttk.Treeview(top, columns=("Description",), show="headings")
+    tree.heading("#1", text="Description")
+    tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+    scrollbar = ttk.Scrollbar(top, orient=tk.VERTICAL, command=tree.yview)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    tree.configure(yscrollcommand=scrollbar.set)
+
+    by_name = {p['name']: p for p in plugins}
+    rows = [(p['name'], p['description']) for p in plugins]
+
+    def populate():
+        insert = tree.insert
+        for name, description in rows:
+            insert("", tk.END, iid=name, text=name, values=(description,))
+
+    # Fill the tree in one idle callback, after the window has been laid out
+    tree.after_idle(populate)
+
+    def run_plugin_wrapper():
+        plugin = by_name.get(tree.focus())
+        if plugin:
+            threading.Thread(target=self.run_plugin, args=(plugin['module'],), daemon=True).start()
+        top.destroy()
+
+    btn = tk.Button(top, text="Run Selected", command=run_plugin_wrapper)
+    btn.pack(pady=10)
+
+
+def patch_plugin_menu(App):
+    """Replace App.show_plugin_menu with the restored Run Plugin dialog."""
+    setattr(App, "show_plugin_menu", show_plugin_menu_patch)
@@ -1,24 +1,34 @@
 import argparse
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
-from cryptography.hazmat.primitives import serialization
+
+# cryptography is imported inside the functions that need it, so that
+# `--help` and argument errors don't pay for loading it.
 
 ROOT = Path(__file__).resolve().parents[1]
 CONFIG_DIR = ROOT / "ai_assistant_config"
+HASH_CHUNK_SIZE = 1 << 20
+
+def _new_private_key():
+    """Generates a fresh RSA-4096 private key."""
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    return rsa.generate_private_key(
+        public_exponent=65537,
+        key_size=4096,
+    )
+
+def _write_key_pair(private_key, private_key_path, public_key_path):
+    """Saves a private key and its public half to PEM files."""
+    from cryptography.hazmat.primitives import serialization
 
-def generate_keys(private_key_path, public_key_path):
-    """Generates an RSA private and public key pair and saves them to PEM files."""
     private_key_path = Path(private_key_path)
     public_key_path = Path(public_key_path)
 
     private_key_path.parent.mkdir(parents=True, exist_ok=True)
     public_key_path.parent.mkdir(parents=True, exist_ok=True)
 
-    private_key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=4096,
-    )
     pem_private = private_key.private_bytes(
         encoding=serialization.Encoding.PEM,
         format=serialization.PrivateFormat.PKCS8,
@@ -35,33 +45,82 @@ def generate_keys(private_key_path, public_key_path):
     public_key_path.write_bytes(pem_public)
     print(f"Public key saved to {public_key_path}")
 
-def sign_file(private_key_path, file_to_sign):
-    """Signs a file with the given private key and creates a .sig file."""
-    private_key_path = Path(private_key_path)
-    file_to_sign = Path(file_to_sign)
+def generate_keys(private_key_path, public_key_path):
+    """Generates an RSA private and public key pair and saves them to PEM files."""
+    _write_key_pair(_new_private_key(), private_key_path, public_key_path)
+
+def generate_keys_batch(path_pairs, max_workers=None):
+    """
+    Generates one key pair per (private_key_path, public_key_path) entry.
+    Keys are generated in parallel threads; OpenSSL releases the GIL during
+    the prime search, so this scales across cores without process start-up.
+    """
+    path_pairs = list(path_pairs)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        keys = executor.map(lambda _: _new_private_key(), path_pairs)
+        for private_key, (private_key_path, public_key_path) in zip(keys, path_pairs):
+            _write_key_pair(private_key, private_key_path, public_key_path)
+
+def _sha256_file(path):
+    """Hashes a file in 1 MiB slices of an mmap so it is never fully loaded into memory."""
+    from cryptography.hazmat.primitives import hashes
+
+    h = hashes.Hash(hashes.SHA256())
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return h.finalize()  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for off in range(0, len(mm), HASH_CHUNK_SIZE):
+                h.update(mm[off:off + HASH_CHUNK_SIZE])
+    return h.finalize()
+
+def load_key(private_key_path):
+    """Loads an unencrypted PEM private key, or returns None if the file is missing."""
+    from cryptography.hazmat.primitives import serialization
 
+    private_key_path = Path(private_key_path)
     if not private_key_path.exists():
         print(f"Error: Private key not found at {private_key_path}")
-        return
+        return None
+    with open(private_key_path, "rb") as key_file:
+        return serialization.load_pem_private_key(key_file.read(), password=None)
+
+def sign_with_key(private_key, file_to_sign):
+    """Signs a file with an already-loaded private key and creates a .sig file."""
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
+    from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
+
+    file_to_sign = Path(file_to_sign)
     if not file_to_sign.exists():
         print(f"Error: File to sign not found at {file_to_sign}")
         return
 
-    with open(private_key_path, "rb") as key_file:
-        private_key = serialization.load_pem_private_key(key_file.read(), password=None)
-
-    file_data = file_to_sign.read_bytes()
+    digest = _sha256_file(file_to_sign)
 
+    # Signing the prehashed digest yields the same signature as signing the raw bytes.
     signature = private_key.sign(
-        file_data,
+        digest,
         padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH),
-        hashes.SHA256()
+        Prehashed(hashes.SHA256())
     )
 
     signature_file = file_to_sign.with_suffix(file_to_sign.suffix + ".sig")
     signature_file.write_bytes(signature)
     print(f"Signature for {file_to_sign.name} saved to {signature_file}")
 
+def sign_file(private_key_path, file_to_sign):
+    """Signs a file with the given private key and creates a .sig file."""
+    sign_many(private_key_path, [file_to_sign])
+
+def sign_many(private_key_path, files):
+    """Signs several files, parsing the private key only once."""
+    private_key = load_key(private_key_path)
+    if private_key is None:
+        return
+    for file_to_sign in files:
+        sign_with_key(private_key, file_to_sign)
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Plugin Signing Utility for Igris.")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -72,8 +131,8 @@ if __name__ == "__main__":
     genkeys_parser.add_argument("--pub", default=str(CONFIG_DIR / "public_key.pem"), help="Path to save the public key.")
 
     # 'sign' command
-    sign_parser = subparsers.add_parser("sign", help="Sign a plugin file.")
-    sign_parser.add_argument("plugin_file", help="The path to the plugin .py file to sign.")
+    sign_parser = subparsers.add_parser("sign", help="Sign one or more plugin files.")
+    sign_parser.add_argument("plugin_file", nargs="+", help="The path(s) to the plugin .py file(s) to sign.")
     sign_parser.add_argument("--key", default=str(CONFIG_DIR / "private_key.pem"), help="Path to the private key to use for signing.")
 
     args = parser.parse_args()
@@ -81,4 +140,4 @@ if __name__ == "__main__":
     if args.command == "genkeys":
         generate_keys(args.priv, args.pub)
     elif args.command == "sign":
-        sign_file(args.key, args.plugin_file)
\ No newline at end of file
+        sign_many(args.key, args.plugin_file)
@@ -7,76 +7,158 @@ the current context (e.g., 'CODING', 'BROWSING') as determined by the
 proactive_context_agent.
 """
 
+import sys
 import json
+import functools
 from pathlib import Path
-from collections import Counter, defaultdict
-from datetime import datetime, timedelta
+from operator import itemgetter
+from datetime import datetime
+
+try:
+    # Optional: stream the memory file instead of materializing all of it
+    import ijson
+except ImportError:
+    ijson = None
+
+_JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
 
 # This path should be consistent with where your other modules (like the logger)
 # are saving the memory file.
 MEMORY_FILE = Path.home() / "OneDrive" / "Documents" / "ai_memory.json"
 
+# Append-only JSONL sidecars (one entry per line). When present they replace the
+# matching list in MEMORY_FILE, and only their most recent lines are read.
+PLUGIN_HISTORY_FILE = MEMORY_FILE.with_name("plugin_history.jsonl")
+CONTEXT_UPDATES_FILE = MEMORY_FILE.with_name("context_updates.jsonl")
+TAIL_LINES = 2000
+
 # How far back/forward to look for a context when associating with a plugin event.
 CONTEXT_WINDOW_MINUTES = 5
+CONTEXT_WINDOW_NS = CONTEXT_WINDOW_MINUTES * 60 * 1_000_000_000
+
+# (plugin_history, context_updates, latest_update) from the last read, keyed by the
+# (st_mtime_ns, st_size) of the memory file and both sidecars.
+_MEMORY_CACHE = {"key": None, "data": None}
+# Transition model built from _MEMORY_CACHE["data"], tagged with the same key.
+_MODEL_CACHE = {"key": None, "model": None}
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ts(ts_str: str) -> int:
+    """Converts an ISO timestamp to integer epoch nanoseconds (memoized; history repeats them)."""
+    return int(datetime.fromisoformat(ts_str).timestamp() * 1_000_000_000)
+
+def _is_context_update(item):
+    return isinstance(item, dict) and "entry" in item and item["entry"].startswith("CONTEXT_UPDATE:")
+
+def _collect_context_updates(items):
+    """Filters CONTEXT_UPDATE entries and tracks the latest one in the same pass."""
+    context_updates, latest, latest_ts = [], None, None
+    for item in items:
+        if _is_context_update(item):
+            context_updates.append(item)
+            ts = item.get("timestamp", "")
+            if latest is None or ts > latest_ts:  # strict: the first of equal timestamps wins, like max()
+                latest, latest_ts = item, ts
+    return context_updates, latest
+
+def _tail_jsonl(path, n):
+    """Parses the last `n` lines of a JSONL file, reading backwards from the end in blocks."""
+    block_size = 64 * 1024
+    with path.open("rb") as f:
+        end = f.seek(0, 2)
+        pos, data = end, b""
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    entries = []
+    for line in data.splitlines()[-n:]:
+        try:
+            entries.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue  # blank line, or a partial line from an interrupted append
+    return entries
 
-def get_suggestion(last_plugin_name: str):
+def _read_memory(use_history_sidecar, use_context_sidecar):
     """
-    Suggests the next plugin to run based on historical patterns and current context.
-
-    1. Determines the user's current context from memory.
-    2. Analyzes plugin execution history to find which plugin most frequently
-       follows `last_plugin_name`.
-    3. Prioritizes suggestions relevant to the current context.
-    4. Falls back to non-contextual suggestions if no specific pattern is found.
-
-    Returns:
-        A dictionary with suggestion details, or None.
+    Reads just the plugin history and the CONTEXT_UPDATE entries. Sidecars are tailed;
+    anything without a sidecar comes from the memory file. With ijson, the rest of
+    general_memory is filtered out while streaming and never held.
     """
-    if not MEMORY_FILE.exists():
-        return None
-
+    plugin_history = _tail_jsonl(PLUGIN_HISTORY_FILE, TAIL_LINES) if use_history_sidecar else None
+    contexts = None
+    if use_context_sidecar:
+        contexts = _collect_context_updates(_tail_jsonl(CONTEXT_UPDATES_FILE, TAIL_LINES))
+    if plugin_history is not None and contexts is not None:
+        return (plugin_history, *contexts)
+
+    if ijson is not None:
+        with MEMORY_FILE.open("rb") as f:
+            if plugin_history is None:
+                plugin_history = list(ijson.items(f, "plugin_history.item"))
+                f.seek(0)
+            if contexts is None:
+                # The proactive agent logs to 'general_memory' via memory_manager.
+                contexts = _collect_context_updates(ijson.items(f, "general_memory.item"))
+        return (plugin_history, *contexts)
+
+    with MEMORY_FILE.open("r", encoding="utf-8") as f:
+        memory = json.load(f)
+    if plugin_history is None:
+        plugin_history = memory.get("plugin_history", [])
+    if contexts is None:
+        contexts = _collect_context_updates(memory.get("general_memory", []))
+    return (plugin_history, *contexts)
+
+def _stamp(path):
     try:
-        with MEMORY_FILE.open("r", encoding="utf-8") as f:
-            memory = json.load(f)
-    except (json.JSONDecodeError, IOError):
+        st = path.stat()
+    except FileNotFoundError:
         return None
+    return (st.st_mtime_ns, st.st_size)
 
-    plugin_history = memory.get("plugin_history", [])
-    # The proactive agent logs to 'general_memory' via memory_manager.
-    # We assume it logs entries like {"timestamp": "...", "entry": "CONTEXT_UPDATE: ..."}
-    general_memory = memory.get("general_memory", [])
+def _load_memory():
+    """Returns (plugin_history, context_updates, latest_update), rereading only when a source has changed on disk."""
+    key = (_stamp(MEMORY_FILE), _stamp(PLUGIN_HISTORY_FILE), _stamp(CONTEXT_UPDATES_FILE))
+    memory_stamp, history_stamp, context_stamp = key
+    if memory_stamp is None and (history_stamp is None or context_stamp is None):
+        return None
+    if _MEMORY_CACHE["key"] != key:
+        try:
+            data = _read_memory(history_stamp is not None, context_stamp is not None)
+        except _JSON_ERRORS + (IOError,):
+            return None
+        _MEMORY_CACHE["key"], _MEMORY_CACHE["data"] = key, data
+    return _MEMORY_CACHE["data"]
 
+def _build_model(plugin_history, context_updates, latest_update):
+    """
+    Builds (current_context, transitions, by_prev) from the plugin history and the
+    context updates, or returns None if there is too little history.
+    We assume the proactive agent logs entries like {"timestamp": "...", "entry": "CONTEXT_UPDATE: ..."}
+    """
     if not plugin_history or len(plugin_history) < 2:
         return None  # Not enough data to find a pattern
 
     # 1. Determine Current Context
     current_context = "IDLE"  # Default context
-    context_updates = [
-        item for item in general_memory
-        if isinstance(item, dict) and "entry" in item and item["entry"].startswith("CONTEXT_UPDATE:")
-    ]
 
-    if context_updates:
-        latest_update = max(context_updates, key=lambda x: x.get("timestamp", ""))
+    if latest_update is not None:
         current_context = latest_update["entry"].split(":", 1)[1].strip()
 
-    # 2. Build a Context-Aware Transition Model: (context, prev_plugin) -> Counter of next_plugins
-    transitions = defaultdict(Counter)
+    # 2. Build a Context-Aware Transition Model: (context, prev_plugin) -> {next_plugin: count}
+    transitions = {}
+    by_prev = {}  # prev_plugin -> the per-context count dicts in `transitions` for it
     sorted_contexts = sorted(
-        [(datetime.fromisoformat(c["timestamp"]), c["entry"].split(":", 1)[1].strip())
+        [(_parse_ts(c["timestamp"]), sys.intern(c["entry"].split(":", 1)[1].strip()))
          for c in context_updates if "timestamp" in c],
         key=lambda x: x[0]
     )
 
-    def get_context_for_timestamp(ts: datetime) -> str:
-        active_context = "IDLE"
-        for context_ts, context_name in reversed(sorted_contexts):
-            if context_ts <= ts:
-                if (ts - context_ts) < timedelta(minutes=CONTEXT_WINDOW_MINUTES):
-                    return context_name
-                break
-        return active_context
-
+    # Parse each transition's timestamp once, then walk transitions and contexts
+    # together in time order instead of rescanning the contexts for every event.
+    events = []
     for i in range(len(plugin_history) - 1):
         prev_item, next_item = plugin_history[i], plugin_history[i+1]
         prev_plugin, next_plugin, ts_str = prev_item.get("plugin_name"), next_item.get("plugin_name"), prev_item.get("timestamp")
@@ -84,25 +166,74 @@ def get_suggestion(last_plugin_name: str):
         if not all([prev_plugin, next_plugin, ts_str]): continue
 
         try:
-            context = get_context_for_timestamp(datetime.fromisoformat(ts_str))
-            transitions[(context, prev_plugin)][next_plugin] += 1
+            # Names repeat across thousands of entries; interned keys hash and compare by identity
+            events.append((_parse_ts(ts_str), sys.intern(prev_plugin), sys.intern(next_plugin)))
         except (ValueError, TypeError): continue
 
+    ci = -1  # index of the latest context at or before the current event
+    n_contexts = len(sorted_contexts)
+    for ts, prev_plugin, next_plugin in sorted(events, key=itemgetter(0)):
+        while ci + 1 < n_contexts and sorted_contexts[ci + 1][0] <= ts:
+            ci += 1
+        context = "IDLE"
+        if ci >= 0 and (ts - sorted_contexts[ci][0]) < CONTEXT_WINDOW_NS:
+            context = sorted_contexts[ci][1]
+        key = (context, prev_plugin)
+        inner = transitions.get(key)
+        if inner is None:
+            inner = transitions[key] = {}
+            by_prev.setdefault(prev_plugin, []).append(inner)
+        inner[next_plugin] = inner.get(next_plugin, 0) + 1
+
+    return current_context, transitions, by_prev
+
+def _load_model():
+    """Returns the transition model, rebuilding it only when the memory sources changed."""
+    memory = _load_memory()
+    if memory is None:
+        return None
+    if _MODEL_CACHE["key"] != _MEMORY_CACHE["key"]:
+        _MODEL_CACHE["model"] = _build_model(*memory)
+        _MODEL_CACHE["key"] = _MEMORY_CACHE["key"]
+    return _MODEL_CACHE["model"]
+
+def get_suggestion(last_plugin_name: str):
+    """
+    Suggests the next plugin to run based on historical patterns and current context.
+
+    1. Determines the user's current context from memory.
+    2. Analyzes plugin execution history to find which plugin most frequently
+       follows `last_plugin_name`.
+    3. Prioritizes suggestions relevant to the current context.
+    4. Falls back to non-contextual suggestions if no specific pattern is found.
+
+    Returns:
+        A dictionary with suggestion details, or None.
+    """
+    model = _load_model()
+    if model is None:
+        return None
+    current_context, transitions, by_prev = model
+    if last_plugin_name not in by_prev:
+        return None  # never seen as a predecessor, so nothing can follow it
+
     # 3. Generate a Suggestion
     # Priority 1: A frequent follower in the CURRENT context
     contextual_key = (current_context, last_plugin_name)
-    if contextual_key in transitions and transitions[contextual_key]:
-        suggestion, count = transitions[contextual_key].most_common(1)[0]
+    if transitions.get(contextual_key):
+        # max() keeps the first of equal counts, matching Counter.most_common
+        suggestion, count = max(transitions[contextual_key].items(), key=itemgetter(1))
         if suggestion != last_plugin_name:
             return {"plugin_name": suggestion, "suggestion": f"In '{current_context}' mode, run '{suggestion}'?", "reason": f"It followed '{last_plugin_name}' {count} time(s) in this context."}
 
     # Priority 2: A frequent follower in ANY context
-    all_context_transitions = Counter()
-    for (ctx, prev), next_counts in transitions.items():
-        if prev == last_plugin_name: all_context_transitions.update(next_counts)
+    all_context_transitions = {}
+    for next_counts in by_prev.get(last_plugin_name, ()):
+        for name, n in next_counts.items():
+            all_context_transitions[name] = all_context_transitions.get(name, 0) + n
 
     if all_context_transitions:
-        suggestion, count = all_context_transitions.most_common(1)[0]
+        suggestion, count = max(all_context_transitions.items(), key=itemgetter(1))
         if suggestion != last_plugin_name:
             return {"plugin_name": suggestion, "suggestion": f"Run '{suggestion}' next?", "reason": f"It often follows '{last_plugin_name}' ({count} time(s) across all contexts)."}
 
@@ -13,26 +13,32 @@ class SystemStatsWidget(tk.Frame):
         self.ram_label = tk.Label(self, text="RAM: --%", fg="white", bg="#222", font=("Segoe UI", 10))
         self.ram_label.pack(pady=(2, 5), padx=10, anchor=tk.W)  # Align left
 
+        # Prime the CPU counter; later non-blocking calls report usage since the previous call
+        psutil.cpu_percent(interval=None)
         self.update_stats()
 
     def update_stats(self):
         """
         Updates the CPU and RAM usage statistics.
         """
-        cpu_usage = psutil.cpu_percent(interval=1)
+        cpu_usage = psutil.cpu_percent(interval=None)  # never blocks the Tk loop
         ram = psutil.virtual_memory()
         ram_usage = ram.percent
 
         self.cpu_label.config(text=f"CPU: {cpu_usage:.1f}%")
         self.ram_label.config(text=f"RAM: {ram_usage:.1f}%")
 
-        # Schedule the update after 1 second
-        self.after(1000, self.update_stats)
+        # Schedule the update after 2 seconds
+        self._after_id = self.after(2000, self.update_stats)
 
     def destroy(self):
         """
         Override destroy method to prevent resource leaks
         """
+        # Cancel the pending refresh so it doesn't fire on a destroyed widget
+        if getattr(self, "_after_id", None):
+            self.after_cancel(self._after_id)
+            self._after_id = None
         super().destroy()
 
 if __name__ == '__main__':
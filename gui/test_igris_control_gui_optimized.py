@@ -0,0 +1,112 @@
+import unittest
+from unittest.mock import MagicMock
+import json
+import random
+import sys
+from collections import deque
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add the project root to the path to allow importing the script
+script_path = Path(__file__).parent
+project_root = script_path.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / 'core'))
+sys.path.insert(0, str(script_path))
+
+# Mock modules that might not be installed or are problematic in a test environment
+# before importing the main script.
+MOCK_MODULES = {
+    'speech_recognition': MagicMock(),
+    'pyttsx3': MagicMock(),
+    'memory_manager': MagicMock(),
+    'igris_phase2_5_patch_integrated': MagicMock(),
+}
+for mod_name, mock_obj in MOCK_MODULES.items():
+    sys.modules.setdefault(mod_name, mock_obj)
+
+import igris_control_gui_main_optimized as igris_gui
+
+
+class TestCommandHistory(unittest.TestCase):
+
+    def make_app(self):
+        app = SimpleNamespace(command_history=deque(maxlen=3), history_index=2)
+        app.remember = lambda command: igris_gui.App._remember_command(app, command)
+        return app
+
+    def test_remember_command_appends_and_resets_browsing(self):
+        app = self.make_app()
+        app.remember("status")
+        self.assertEqual(list(app.command_history), ["status"])
+        self.assertIsNone(app.history_index)
+
+    def test_remember_command_skips_immediate_repeats(self):
+        app = self.make_app()
+        for command in ("a", "a", "b", "a"):
+            app.remember(command)
+        self.assertEqual(list(app.command_history), ["a", "b", "a"])
+
+    def test_remember_command_is_bounded(self):
+        app = self.make_app()
+        for command in ("a", "b", "c", "d"):
+            app.remember(command)
+        self.assertEqual(list(app.command_history), ["b", "c", "d"])
+
+
+class TestFindJsonObject(unittest.TestCase):
+
+    def test_returns_first_balanced_object(self):
+        text = 'Sure! {"task_name": "x", "params": {"a": 1}} and {"other": 2}'
+        self.assertEqual(igris_gui.find_json_object(text), '{"task_name": "x", "params": {"a": 1}}')
+
+    def test_ignores_braces_and_escaped_quotes_in_strings(self):
+        obj = {"action": 'echo "}{" \\ done', "nested": {"k": "{"}}
+        raw = json.dumps(obj)
+        self.assertEqual(json.loads(igris_gui.find_json_object(f"prefix {raw} suffix")), obj)
+
+    def test_returns_none_without_a_complete_object(self):
+        self.assertIsNone(igris_gui.find_json_object("no json here"))
+        self.assertIsNone(igris_gui.find_json_object('{"unterminated": {"a": 1}'))
+
+
+def _review_route_by_keywords(text):
+    """The keyword cascade REVIEW_ROUTE_RE replaced."""
+    lower = text.lower()
+    if "system" in lower and ("status" in lower or "stats" in lower):
+        return "sysstat"
+    if "cpu" in lower and "status" in lower:
+        return "cpu"
+    if "uptime" in lower:
+        return "uptime"
+    if "disk space" in lower or "disk usage" in lower:
+        return "disk"
+    return None
+
+
+class TestReviewRoutes(unittest.TestCase):
+
+    def route(self, text):
+        match = igris_gui.REVIEW_ROUTE_RE.search(text)
+        return match.lastgroup if match else None
+
+    def test_known_queries(self):
+        self.assertEqual(self.route("Show me SYSTEM stats"), "sysstat")
+        self.assertEqual(self.route("cpu status please"), "cpu")
+        self.assertEqual(self.route("what's the uptime?"), "uptime")
+        self.assertEqual(self.route("check disk\nusage"), None)
+        self.assertEqual(self.route("check disk usage"), "disk")
+        self.assertEqual(self.route("status of the system and the cpu"), "sysstat")
+        self.assertIsNone(self.route("tell me a joke"))
+
+    def test_matches_keyword_cascade(self):
+        words = ["system", "status", "stats", "cpu", "uptime", "disk", "space", "usage",
+                 "Disk Usage", "SYSTEM", "the", "\n", "sta", "tus"]
+        rng = random.Random(1234)
+        for _ in range(5000):
+            text = rng.choice(["", " ", "-"]).join(rng.choices(words, k=rng.randint(0, 6)))
+            self.assertEqual(self.route(text), _review_route_by_keywords(text), text)
+
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -2,8 +2,11 @@
 Widget Manager for Igris OS Desktop Environment (Phase 5)
 - Manages the lifecycle and placement of widgets on the desktop.
 """
+import logging
 import tkinter as tk
 
+logger = logging.getLogger(__name__)
+
 class WidgetManager:
 
     """Manages widgets within the Igris Shell."""
@@ -18,26 +21,26 @@ class WidgetManager:
         self._widget_count += 1
 
         if widget_name in self.widgets:
-            print(f"[WidgetManager] Widget '{widget_name}' already exists.")
+            logger.debug("Widget '%s' already exists.", widget_name)
             return None
 
         try:
             widget = widget_class(self.shell, *args, **kwargs)
             self.widgets[widget_name] = widget
-            print(f"[WidgetManager] Created widget '{widget_name}'.")
+            logger.debug("Created widget '%s'.", widget_name)
             return widget
         except Exception as e:
-            print(f"[WidgetManager] Failed to create widget '{widget_name}': {e}")
+            logger.warning("Failed to create widget '%s': %s", widget_name, e)
             return None
 
     def destroy_widget(self, widget_name):
         """Finds a managed widget by name and destroys it."""
         widget = self.widgets.pop(widget_name, None)
         if widget:
-            print(f"[WidgetManager] Destroying widget '{widget_name}'.")
+            logger.debug("Destroying widget '%s'.", widget_name)
             widget.destroy()
         else:
-            print(f"[WidgetManager] No widget found for '{widget_name}' to destroy.")
+            logger.debug("No widget found for '%s' to destroy.", widget_name)
 
     def list_widgets(self):
         """Returns a list of currently managed widget names."""
@@ -49,12 +52,12 @@ class WidgetManager:
 
     def place_widget(self, widget_name, x=0, y=0, anchor=tk.NW):
         """Places the widget at the specified coordinates."""
-        widget = self.get_widget(widget_name)
+        widget = self.widgets.get(widget_name)
         if widget:
             widget.place(x=x, y=y, anchor=anchor)
-            print(f"[WidgetManager] Placed widget '{widget_name}' at x={x}, y={y}.")
+            logger.debug("Placed widget '%s' at x=%s, y=%s.", widget_name, x, y)
         else:
-            print(f"[WidgetManager] Widget '{widget_name}' not found. Cannot place.")
+            logger.debug("Widget '%s' not found. Cannot place.", widget_name)
 
 if __name__ == '__main__':
     # Basic test
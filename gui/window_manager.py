@@ -2,13 +2,17 @@
 Window Manager for Igris OS Desktop Environment (Phase 5)
 - Manages the lifecycle and placement of application windows.
 """
+import logging
 import tkinter as tk
 
+logger = logging.getLogger(__name__)
+
 class WindowManager:
     """Manages Toplevel windows within the Igris Shell."""
     def __init__(self, shell_root):
         self.shell = shell_root
         self.windows = {}  # Maps app_name to Toplevel window instance
+        self._name_by_widget = {}  # Maps id(window) back to app_name
         self._window_count = 0
         self.taskbar = None
 
@@ -25,10 +29,11 @@ class WindowManager:
         else:
             unique_name = app_name
 
-        if unique_name in self.windows:
-            print(f"[WindowManager] Window for '{unique_name}' already exists. Focusing.")
-            self.windows[unique_name].lift()
-            return self.windows[unique_name]
+        existing = self.windows.get(unique_name)
+        if existing is not None:
+            logger.debug("Window for '%s' already exists. Focusing.", unique_name)
+            existing.lift()
+            return existing
 
         window = tk.Toplevel(self.shell)
         window.title(unique_name)
@@ -46,41 +51,41 @@ class WindowManager:
             window.bind("<FocusIn>", lambda e, name=unique_name: self.taskbar.set_active_app(name))
 
         self.windows[unique_name] = window
+        self._name_by_widget[id(window)] = unique_name
         if self.taskbar:
             self.taskbar.add_app(unique_name)
 
-        print(f"[WindowManager] Created window for '{unique_name}'.")
+        logger.debug("Created window for '%s'.", unique_name)
         return window
 
     def destroy_window(self, app_name):
         """Finds a managed window by name and destroys it."""
         window = self.windows.pop(app_name, None)
         if window:
+            self._name_by_widget.pop(id(window), None)
             if self.taskbar:
                 self.taskbar.remove_app(app_name)
-            print(f"[WindowManager] Destroying window for '{app_name}'.")
+            logger.debug("Destroying window for '%s'.", app_name)
             window.destroy()
         else:
-            print(f"[WindowManager] No window found for '{app_name}' to destroy.")
+            logger.debug("No window found for '%s' to destroy.", app_name)
 
     def close_active_window(self):
         """Closes the currently focused Toplevel window."""
         active_window = self.shell.focus_get()
         # Ensure the focused widget is a Toplevel window managed by us
         if active_window and isinstance(active_window, tk.Toplevel):
-            for name, window_instance in self.windows.items():
-                if window_instance == active_window:
-                    self.destroy_window(name)
-                    return f"Closed active window: {name}"
+            name = self._name_by_widget.get(id(active_window))
+            if name:
+                self.destroy_window(name)
+                return f"Closed active window: {name}"
         return "No active application window to close."
 
     def get_active_window_name(self):
         """Returns the name of the currently focused Toplevel window, if managed."""
         active_window = self.shell.focus_get()
         if active_window and isinstance(active_window, tk.Toplevel):
-            for name, window_instance in self.windows.items():
-                if window_instance == active_window:
-                    return name
+            return self._name_by_widget.get(id(active_window))
         return None
 
     def focus_window(self, app_name):
@@ -105,10 +110,15 @@ class WindowManager:
         win_width = screen_width // cols
         win_height = (screen_height - 30) // rows # Adjust for taskbar if any
 
-        for i, window in enumerate(self.windows.values()):
-            row, col = divmod(i, cols)
-            x, y = col * win_width, row * win_height
-            window.geometry(f"{win_width}x{win_height}+{x}+{y}")
+        # Work out every geometry first, apply them back to back, then let Tk
+        # flush the pending window-manager requests in a single idle pass.
+        geometries = [
+            f"{win_width}x{win_height}+{(i % cols) * win_width}+{(i // cols) * win_height}"
+            for i in range(num_windows)
+        ]
+        for window, geometry in zip(self.windows.values(), geometries):
+            window.geometry(geometry)
+        self.shell.update_idletasks()
 
         return f"Tiled {num_windows} windows."
 
@@ -1,5 +1,7 @@
 import json
 import os
+from pathlib import Path
+from task_store import write_tasks
 
 TASK_FILE = "task_list.json"
 MODULE_DIR = "modules"
@@ -9,8 +11,7 @@ def load_tasks():
         return json.load(f)
 
 def save_tasks(tasks):
-    with open(TASK_FILE, "w") as f:
-        json.dump(tasks, f, indent=4)
+    write_tasks(TASK_FILE, tasks)
 
 def mock_ai_response(prompt):
     # Simulated AI generation
@@ -18,14 +19,13 @@ def mock_ai_response(prompt):
 
 def run_tasks():
     tasks = load_tasks()
-    for task in tasks:
-        if not task["done"]:
-            print(f"Running: {task['name']}")
-            code = mock_ai_response(task["prompt"])
-            module_path = os.path.join(MODULE_DIR, f"{task['name']}.py")
-            with open(module_path, "w") as f:
-                f.write(code)
-            task["done"] = True
+    pending = [task for task in tasks if not task.get("done", False)]
+    for task in pending:
+        print(f"Running: {task['name']}")
+        code = mock_ai_response(task["prompt"])
+        module_path = os.path.join(MODULE_DIR, f"{task['name']}.py")
+        Path(module_path).write_text(code, encoding="utf-8")
+        task["done"] = True
     save_tasks(tasks)
     print("All tasks completed.")
 
@@ -1,10 +1,15 @@
 import json
 import os
-import subprocess
+from pathlib import Path
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from task_store import write_tasks
 
 TASK_FILE = "task_list.json"
 MODULE_DIR = "modules"
 OLLAMA_MODEL = "hf.co/bartowski/Llama-3.2-1B-Instruct-GGUF:Q5_K_M"  # Adjust if you change your model
+OLLAMA_URL = "http://127.0.0.1:11434/api/generate"
+MAX_CONCURRENT_TASKS = 4  # requests in flight against the resident model
 
 def load_tasks():
     if not os.path.exists(TASK_FILE):
@@ -14,24 +19,20 @@ def load_tasks():
         return json.load(f)
 
 def save_tasks(tasks):
-    with open(TASK_FILE, "w", encoding="utf-8") as f:
-        json.dump(tasks, f, indent=4)
+    write_tasks(TASK_FILE, tasks)
 
-def call_ollama(prompt):
+def call_ollama(session, prompt):
+    """Generates code through the Ollama HTTP API, which keeps the model loaded between tasks."""
     try:
         full_prompt = f"Write a working Python script that does the following task. Do not include explanations or markdown.\nTask: {prompt}"
-        result = subprocess.run(
-            ["ollama", "run", OLLAMA_MODEL],
-            input=full_prompt,
-            capture_output=True,
-            text=True,
+        response = session.post(
+            OLLAMA_URL,
+            json={"model": OLLAMA_MODEL, "prompt": full_prompt, "stream": False},
             timeout=60
-            encoding='utf-8', # <--- Force UTF-8 decoding
-            errors='replace'  # <--- Replace unknown characters instead of crashing
         )
-        if result.returncode != 0:
-            return f"# Ollama error: {result.stderr.strip()}"
-        return result.stdout.strip()
+        if response.status_code != 200:
+            return f"# Ollama error: {response.text.strip()}"
+        return response.json().get("response", "").strip()
     except Exception as e:
         return f"# Exception occurred: {e}"
 
@@ -39,13 +40,15 @@ def run_tasks():
     tasks = load_tasks()
     os.makedirs(MODULE_DIR, exist_ok=True)
 
-    for task in tasks:
-        if not task.get("done", False):
-            print(f"[+] Running: {task['name']}")
-            script_code = call_ollama(task["prompt"])
+    pending = [task for task in tasks if not task.get("done", False)]
+    for task in pending:
+        print(f"[+] Running: {task['name']}")
+
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TASKS) as pool:
+        results = pool.map(lambda task: call_ollama(session, task["prompt"]), pending)
+        for task, script_code in zip(pending, results):
             module_path = os.path.join(MODULE_DIR, f"{task['name']}.py")
-            with open(module_path, "w", encoding="utf-8") as f:
-                f.write(script_code)
+            Path(module_path).write_text(script_code, encoding="utf-8")
             task["done"] = True
             print(f"[✓] Saved to: {module_path}")
 
@@ -1,6 +1,8 @@
 import json
 import os
+from pathlib import Path
 import subprocess
+from task_store import write_tasks
 
 TASK_FILE = "task_list.json"
 MODULE_DIR = "modules"
@@ -11,19 +13,18 @@ def load_tasks():
         return json.load(f)
 
 def save_tasks(tasks):
-    with open(TASK_FILE, "w") as f:
-        json.dump(tasks, f, indent=4)
+    write_tasks(TASK_FILE, tasks)
 
 def call_ollama(prompt):
     try:
-        full_prompt = f"Write a working Python script that does the following task. Do not include explanations or markdown.\n"
-        f"Task: {prompt}"
+        full_prompt = (f"Write a working Python script that does the following task. Do not include explanations or markdown.\n"
+                       f"Task: {prompt}")
         result = subprocess.run(
             ["ollama", "run", OLLAMA_MODEL],
             input=full_prompt,
             capture_output=True,
             text=True,
-            timeout=60
+            timeout=60,
             encoding='utf-8',           # ← Add this
             errors='replace'            # ← Add this to skip unreadable characters
         )
@@ -35,14 +36,13 @@ def call_ollama(prompt):
 
 def run_tasks():
     tasks = load_tasks()
-    for task in tasks:
-        if not task["done"]:
-            print(f"Running: {task['name']}")
-            code = call_ollama(task["prompt"])
-            module_path = os.path.join(MODULE_DIR, f"{task['name']}.py")
-            with open(module_path, "w", encoding="utf-8") as f:
-                f.write(code)
-            task["done"] = True
+    pending = [task for task in tasks if not task.get("done", False)]
+    for task in pending:
+        print(f"Running: {task['name']}")
+        code = call_ollama(task["prompt"])
+        module_path = os.path.join(MODULE_DIR, f"{task['name']}.py")
+        Path(module_path).write_text(code, encoding="utf-8")
+        task["done"] = True
     save_tasks(tasks)
     print("All tasks completed.")
 
@@ -0,0 +1,13 @@
+import json
+import os
+from pathlib import Path
+
+
+def write_tasks(path, tasks):
+    """Atomically replace the task list at path, so an interrupted save never truncates it."""
+    tmp_path = Path(path).with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(tasks, indent=4))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
@@ -8,7 +8,8 @@ Implements:
 """
 
 from __future__ import annotations
-import os, json, re, getpass, time, sys, subprocess, hashlib, hmac
+import os, json, re, getpass, time, sys, subprocess, hashlib, hmac, shlex
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
@@ -25,16 +26,25 @@ DEFAULT_IDENTITY = {
     ),
 }
 
+@lru_cache(maxsize=16)
+def _read_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    # mtime/size are only part of the key, so an edited file is re-read.
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+def _read_json(path: os.PathLike | str) -> Any:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return _read_json_cached(str(path), st.st_mtime_ns, st.st_size)
+
 def load_assistant_identity(path: os.PathLike | str) -> Dict[str, Any]:
-    p = Path(path)
-    data: Dict[str, Any] = {}
-    if p.is_file():
-        try:
-            data = json.loads(p.read_text(encoding="utf-8"))
-            if not isinstance(data, dict):
-                data = {}
-        except Exception:
-            data = {}
+    data = _read_json(path)
+    if not isinstance(data, dict):
+        data = {}
     merged = dict(DEFAULT_IDENTITY)
     merged.update(data or {})
     for k in ("name", "role", "base_context"):
@@ -50,25 +60,29 @@ def load_policy(path: os.PathLike | str | None = None) -> Dict[str, Any]:
         except Exception:
             default = "ai_script_policy.json"
         path = default
-    try:
-        return json.loads(Path(path).read_text(encoding="utf-8"))
-    except Exception:
-        return {}
+    data = _read_json(path)
+    # Copy so callers can't modify the cached object behind everyone's back
+    return dict(data) if isinstance(data, dict) else {}
 
 # -----------------------------
 # Shared Admin Authentication
 # -----------------------------
 
-def _constant_time_eq(a: str, b: str) -> bool:
-    return hmac.compare_digest(a, b)
+@lru_cache(maxsize=8)
+def _pin_hash_bytes(hex_digest: str) -> bytes:
+    return bytes.fromhex(hex_digest)
 
 def verify_admin_pin(raw_pin: str, policy: dict | None = None) -> bool:
     policy = policy or load_policy()
     want = (policy or {}).get("admin_pin_hash", "")
     if not want:
         return False
-    got = hashlib.sha256((raw_pin or "").encode("utf-8")).hexdigest()
-    return _constant_time_eq(got, want)
+    try:
+        want_bytes = _pin_hash_bytes(want)
+    except ValueError:
+        return False
+    got = hashlib.sha256((raw_pin or "").encode("utf-8")).digest()
+    return hmac.compare_digest(got, want_bytes)
 
 def cli_prompt_for_pin(policy: dict | None = None, attempts: int = 3, backoff_s: float = 1.0) -> bool:
     policy = policy or load_policy()
@@ -132,27 +146,113 @@ You MUST respond with a single, valid JSON object only — no prose, no markdown
 If you need to include multiple fields, put them inside that single object.
 """
 
+_BRACE_OBJ = re.compile(r"\{.*?\}", re.DOTALL)
+
 def _strip_md_fences(text: str) -> str:
-    text = re.sub(r"^```(?:json)?\\s*", "", text.strip(), flags=re.IGNORECASE)
-    text = re.sub(r"\\s*```$", "", text.strip())
-    return text.strip()
+    t = text.strip()
+    if t.startswith("```"):
+        # Drop the opening fence along with its info string (```json etc.).
+        nl = t.find("\n")
+        t = t[nl+1:] if nl != -1 else t[3:]
+    if t.endswith("```"):
+        t = t[:-3]
+    return t.strip()
+
+class _BraceScanner:
+    """Incremental matcher for the first balanced {...} in a byte stream.
+
+    Braces inside JSON string literals (including escaped quotes) don't
+    count towards the depth. State is kept between feed() calls so a
+    streamed response is only scanned once.
+    """
+
+    __slots__ = ("buf", "start", "pos", "depth", "in_string", "escape")
+
+    def __init__(self) -> None:
+        self.buf = bytearray()
+        self.start = -1
+        self.pos = 0
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+
+    def feed(self, chunk: bytes) -> int:
+        """Append chunk; return the end offset of the object, or -1 if still open."""
+        buf = self.buf
+        buf += chunk
+        if self.start == -1:
+            self.start = buf.find(b"{", self.pos)
+            if self.start == -1:
+                self.pos = len(buf)
+                return -1
+            self.pos = self.start
+        view = memoryview(buf)
+        depth, in_string, escape = self.depth, self.in_string, self.escape
+        try:
+            for i in range(self.pos, len(buf)):
+                c = view[i]
+                if in_string:
+                    if escape:
+                        escape = False
+                    elif c == 0x5C:
+                        escape = True
+                    elif c == 0x22:
+                        in_string = False
+                elif c == 0x22:
+                    in_string = True
+                elif c == 0x7B:
+                    depth += 1
+                elif c == 0x7D:
+                    depth -= 1
+                    if depth == 0:
+                        self.pos = i + 1
+                        return i + 1
+            self.pos = len(buf)
+            return -1
+        finally:
+            self.depth, self.in_string, self.escape = depth, in_string, escape
+            view.release()
 
 def _extract_jsonish(text: str) -> str:
     s = text.strip()
     if s.startswith("{") and s.endswith("}"):
         return s
-    start = s.find("{")
-    if start == -1:
+    scanner = _BraceScanner()
+    end = scanner.feed(s.encode("utf-8"))
+    if end == -1:
         return s
-    depth = 0
-    for i, ch in enumerate(s[start:], start=start):
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0:
-                return s[start:i+1]
-    return s
+    return scanner.buf[scanner.start:end].decode("utf-8")
+
+_SESSION = None
+
+def _get_session():
+    # One keep-alive session per process; requests stays an optional import.
+    global _SESSION
+    if _SESSION is None:
+        import requests  # type: ignore
+        from requests.adapters import HTTPAdapter  # type: ignore
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        _SESSION = session
+    return _SESSION
+
+def _stream_response(resp) -> str:
+    # Ollama streams one {"response": ..., "done": ...} object per line.
+    # Stop reading as soon as the model has closed its top-level JSON object.
+    parts = []
+    scanner = _BraceScanner()
+    for line in resp.iter_lines():
+        if not line:
+            continue
+        chunk = json.loads(line)
+        piece = chunk.get("response", "")
+        if piece:
+            parts.append(piece)
+            if scanner.feed(piece.encode("utf-8")) != -1:
+                break
+        if chunk.get("done"):
+            break
+    return "".join(parts)
 
 def ask_ollama(prompt: str,
                model: str = "llama3",
@@ -164,12 +264,11 @@ def ask_ollama(prompt: str,
         final_prompt += "\\n\\n" + JSON_ENFORCEMENT_SUFFIX.strip()
     if system_prefix:
         final_prompt = system_prefix.strip() + "\\n\\n" + final_prompt
-    payload = {"model": model, "prompt": final_prompt, "stream": False}
+    payload = {"model": model, "prompt": final_prompt, "stream": True}
     try:
-        import requests  # type: ignore
-        resp = requests.post(endpoint, json=payload, timeout=120)
-        resp.raise_for_status()
-        raw = resp.json().get("response", "")
+        with _get_session().post(endpoint, json=payload, stream=True, timeout=120) as resp:
+            resp.raise_for_status()
+            raw = _stream_response(resp)
     except Exception:
         raw = '{"status":"ok","note":"ollama-unavailable-dry-run"}'
     cleaned = _strip_md_fences(raw)
@@ -187,7 +286,7 @@ def strict_json_from_text(text: str) -> dict | None:
         t = t[3:].strip()
     if t.endswith("```"):
         t = t[:-3].strip()
-    m = re.search(r"\\{.*?\\}", t, re.DOTALL)
+    m = _BRACE_OBJ.search(t)
     if not m:
         return None
     try:
@@ -207,6 +306,14 @@ def parse_task_response(obj: Dict[str, Any]) -> Tuple[Optional[str], Optional[st
     requires_admin = bool(obj.get("requires_admin", False))
     return task, action, requires_admin
 
-def run_shell(cmd: str, *, timeout: int | None = None):
-    p = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=timeout)
+def run_shell(cmd: str | list[str], *, timeout: int | None = None, shell: bool = False):
+    # Run the program directly unless the caller needs shell syntax (pipes,
+    # redirects). Windows parses a command string itself, so it's passed as-is.
+    if shell:
+        argv = cmd if isinstance(cmd, str) else shlex.join(cmd)
+    elif isinstance(cmd, str):
+        argv = cmd if os.name == "nt" else shlex.split(cmd)
+    else:
+        argv = list(cmd)
+    p = subprocess.run(argv, shell=shell, capture_output=True, text=True, timeout=timeout)
     return p.returncode, (p.stdout or "").strip(), (p.stderr or "").strip()
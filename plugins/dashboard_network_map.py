@@ -4,9 +4,29 @@ Displays live results from ping_sweep and network_scanner plugins.
 """
 import tkinter as tk
 from tkinter import ttk
-import subprocess
 import threading
+import time
 import os
+import sys
+from pathlib import Path
+
+# Plugin loaders exec this file by path, so make the sibling scanner importable
+PLUGIN_DIR = Path(__file__).resolve().parent
+if str(PLUGIN_DIR) not in sys.path:
+    sys.path.insert(0, str(PLUGIN_DIR))
+
+from network_scanner import scan_subnet
+
+SCAN_CACHE_TTL = 10.0  # seconds; repeated Scan LAN clicks reuse the last result
+_SCAN_CACHE = {}  # subnet hint -> (monotonic timestamp, hosts)
+
+def _cached_scan(subnet):
+    hit = _SCAN_CACHE.get(subnet)
+    if hit and time.monotonic() - hit[0] < SCAN_CACHE_TTL:
+        return hit[1]
+    hosts = scan_subnet(subnet)
+    _SCAN_CACHE[subnet] = (time.monotonic(), hosts)
+    return hosts
 
 class NetworkDashboard(tk.Tk):
     def __init__(self):
@@ -32,16 +52,18 @@ class NetworkDashboard(tk.Tk):
 
     def _scan_logic(self):
         try:
-            script_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "network_scanner.py"))
-            result = subprocess.check_output(["python", script_path], text=True)
-            lines = result.strip().split("\n")[1:]  # skip header
-            for line in lines:
-                parts = [p.strip() for p in line.split("|")]
-                if len(parts) == 3:
-                    self.tree.insert("", "end", values=parts)
+            hosts = _cached_scan(os.environ.get("IGRIS_SUBNET") or None)
+            rows = [(h["ip"], h.get("mac", ""), h.get("hostname", "")) for h in hosts]
+            # Tk isn't thread-safe; hand the whole result to the main loop at once
+            self.after(0, self._populate, rows)
         except Exception as e:
             print("Scan failed:", e)
 
+    def _populate(self, rows):
+        insert = self.tree.insert
+        for values in rows:
+            insert("", "end", values=values)
+
 if __name__ == "__main__":
     app = NetworkDashboard()
     app.mainloop()
\ No newline at end of file
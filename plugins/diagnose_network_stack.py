@@ -1,11 +1,106 @@
 """ 
 Diagnose Network Stack
-Checks adapter IP, subnet, ARP visibility, and Scapy usability.
+Checks adapter IP, subnet, ARP visibility, and ARP broadcast reachability
+(raw AF_PACKET socket on Linux, Scapy elsewhere).
 """
 import socket
 import os
 import subprocess
 import platform
+import re
+import struct
+import time
+
+def _local_ipv4():
+    # Connecting a UDP socket only picks the outbound interface; nothing is
+    # sent and no name resolution happens.
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("10.255.255.255", 1))
+            return s.getsockname()[0]
+    except OSError:
+        return socket.gethostbyname(socket.gethostname())
+
+# One ARP entry per line: Windows "arp -a" puts the MAC right after the IP,
+# Linux "ip neigh" has "dev <iface> lladdr" in between.
+_ARP_RE = re.compile(
+    r"^\s*(\d+\.\d+\.\d+\.\d+)\s+(?:dev\s+\S+\s+lladdr\s+)?"
+    r"([0-9a-f]{2}(?:[:-][0-9a-f]{2}){5})",
+    re.IGNORECASE | re.MULTILINE,
+)
+_ARP_PDST_OFFSET = 14 + 24  # Ethernet header + ARP fields before the target IP
+_ETH_P_ARP = 0x0806
+_SIOCGIFADDR = 0x8915
+
+def _iface_for_ip(ip):
+    import fcntl
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        for _, name in socket.if_nameindex():
+            try:
+                req = struct.pack("256s", name.encode()[:15])
+                addr = fcntl.ioctl(s.fileno(), _SIOCGIFADDR, req)[20:24]
+            except OSError:
+                continue
+            if socket.inet_ntoa(addr) == ip:
+                return name
+    return None
+
+def _arp_sweep_raw(ip, prefix, timeout=1):
+    """Linux: ARP sweep over an AF_PACKET socket, no scapy involved."""
+    iface = _iface_for_ip(ip)
+    if iface is None:
+        raise OSError(f"No interface has address {ip}")
+    with open(f"/sys/class/net/{iface}/address") as f:
+        mac = bytes.fromhex(f.read().strip().replace(":", ""))
+    # Everything but the last octet of the target IP is the same for all probes
+    head = (b"\xff" * 6 + mac + struct.pack("!H", _ETH_P_ARP)
+            + struct.pack("!HHBBH", 1, 0x0800, 6, 4, 1)
+            + mac + socket.inet_aton(ip) + b"\x00" * 6
+            + socket.inet_aton(f"{prefix}.0")[:3])
+    with socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(_ETH_P_ARP)) as sock:
+        sock.bind((iface, 0))
+        for i in range(1, 255):
+            sock.send(head + bytes((i,)))
+        found = {}
+        deadline = time.monotonic() + timeout
+        while (left := deadline - time.monotonic()) > 0:
+            sock.settimeout(left)
+            try:
+                frame = sock.recv(128)
+            except socket.timeout:
+                break
+            # ARP reply (op 2): sender MAC at 22..28, sender IP at 28..32
+            if len(frame) >= 42 and frame[20:22] == b"\x00\x02":
+                found[socket.inet_ntoa(frame[28:32])] = frame[22:28].hex(":")
+    return list(found.items())
+
+def _arp_sweep_scapy(prefix, timeout=1):
+    from scapy.all import ARP, Ether, conf, sniff
+    # Let scapy build one frame, then patch the target address into copies
+    # of its bytes instead of building 254 packets field by field.
+    target = f"{prefix}.1"
+    tmpl = bytes(Ether(dst="ff:ff:ff:ff:ff:ff") / ARP(pdst=target))
+    head = tmpl[:_ARP_PDST_OFFSET] + socket.inet_aton(target)[:3]
+    tail = tmpl[_ARP_PDST_OFFSET + 4:]
+    iface = conf.route.route(target)[0]
+    sock = conf.L2socket(iface=iface)
+    try:
+        for i in range(1, 255):
+            sock.send(head + bytes((i,)) + tail)
+        replies = sniff(opened_socket=sock, timeout=timeout,
+                        lfilter=lambda p: ARP in p and p[ARP].op == 2)
+    finally:
+        sock.close()
+    return list({r[ARP].psrc: r[ARP].hwsrc for r in replies}.items())
+
+def _arp_sweep(ip, prefix, timeout=1):
+    """ARP every host in prefix.1-254 and return unique (ip, mac) replies."""
+    if hasattr(socket, "AF_PACKET"):
+        try:
+            return _arp_sweep_raw(ip, prefix, timeout)
+        except OSError:
+            pass  # no CAP_NET_RAW or unknown interface; let scapy try
+    return _arp_sweep_scapy(prefix, timeout)
 
 def run():
     output = []
@@ -13,7 +108,7 @@ def run():
     # 1. IP Address Check
     output.append("🧠 Network Adapter Info:")
     try:
-        ip = socket.gethostbyname(socket.gethostname())
+        ip = _local_ipv4()
         output.append(f"  • IPv4 Address: {ip}")
         subnet = ".".join(ip.split(".")[:3]) + ".0/24"
         output.append(f"  • Assumed Subnet: {subnet}")
@@ -27,24 +122,22 @@ def run():
             result = subprocess.check_output(["arp", "-a"], text=True)
         else:
             result = subprocess.check_output(["ip", "neigh"], text=True)
-        lines = [line for line in result.split("\n") if line.strip()]
-        if lines:
-            output.extend(["  • " + line for line in lines[:10]])
+        entries = _ARP_RE.findall(result)
+        if entries:
+            output.extend([f"  • {addr} - {mac}" for addr, mac in entries[:10]])
         else:
             output.append("  ❌ ARP table is empty.")
     except Exception as e:
         output.append(f"  ❌ Failed to retrieve ARP table: {e}")
 
-    # 3. Scapy Layer Check
-    output.append("\n⚙️ Scapy ARP Broadcast Test:")
+    # 3. ARP Broadcast Check
+    output.append("\n⚙️ ARP Broadcast Test:")
     try:
-        from scapy.all import ARP, Ether, srp
-        pkt = Ether(dst="ff:ff:ff:ff:ff:ff") / ARP(pdst=subnet)
-        ans, _ = srp(pkt, timeout=2, verbose=False)
+        ans = _arp_sweep(ip, subnet.rsplit(".", 1)[0])
         if ans:
             output.append(f"  ✅ {len(ans)} ARP response(s) received.")
-            for _, r in ans[:5]:
-                output.append(f"    → {r.psrc} - {r.hwsrc}")
+            for r_ip, r_mac in ans[:5]:
+                output.append(f"    → {r_ip} - {r_mac}")
         else:
             output.append("  ❌ No ARP responses received.")
     except ImportError:
@@ -1,10 +1,20 @@
 """
 Encrypts the latest security audit file from the /audits directory.
-Uses Fernet symmetric encryption.
+Uses AES-256-GCM.
+
+The output starts with a 4-byte magic followed by independently sealed
+chunks, each written as a 4-byte big-endian length and nonce || ciphertext.
+Every chunk's associated data binds its index and whether it is the final
+chunk, so chunks can't be reordered or dropped. Neither side has to hold
+the whole audit in memory. Use decrypt_audit_file() to read it back; it
+also understands files written with the older Fernet key.
 """
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import os
+import struct
 
 # Try to import ROOT_DIR for consistent pathing
 try:
@@ -13,41 +23,112 @@ except ImportError:
     ROOT_DIR = Path(__file__).resolve().parent.parent
 
 AUDITS_DIR = ROOT_DIR / "audits"
-KEY_FILE = AUDITS_DIR / "audit_encryption.key"
+KEY_FILE = AUDITS_DIR / "audit_encryption_aes256.key"
+LEGACY_KEY_FILE = AUDITS_DIR / "audit_encryption.key"
+CHUNK_SIZE = 64 * 1024
+MAGIC = b"IGA1"
+_LEN = struct.Struct("!I")
+_AAD = struct.Struct("!Q?")
+
+def _load_or_create_key() -> bytes:
+    if KEY_FILE.exists():
+        return KEY_FILE.read_bytes()
+    key = AESGCM.generate_key(bit_length=256)
+    KEY_FILE.write_bytes(key)
+    return key
+
+_CIPHER = None
+_CIPHER_STAMP = None
+
+def _get_cipher() -> AESGCM:
+    """Return the AESGCM instance for KEY_FILE, rebuilt only if the key file changes."""
+    global _CIPHER, _CIPHER_STAMP
+    key = None if KEY_FILE.exists() else _load_or_create_key()
+    st = KEY_FILE.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _CIPHER is None or stamp != _CIPHER_STAMP:
+        _CIPHER = AESGCM(key or KEY_FILE.read_bytes())
+        _CIPHER_STAMP = stamp
+    return _CIPHER
+
+def encrypt_file(aesgcm: AESGCM, source_path: Path, dest_path: Path) -> None:
+    with open(source_path, "rb") as src, open(dest_path, "wb") as dst:
+        dst.write(MAGIC)
+        index = 0
+        chunk = src.read(CHUNK_SIZE)
+        while True:
+            # Read one chunk ahead so the last one can be marked as final
+            nxt = src.read(CHUNK_SIZE)
+            nonce = os.urandom(12)
+            sealed = nonce + aesgcm.encrypt(nonce, chunk, _AAD.pack(index, not nxt))
+            dst.write(_LEN.pack(len(sealed)))
+            dst.write(sealed)
+            if not nxt:
+                break
+            chunk = nxt
+            index += 1
+
+def _decrypt_legacy(src, dst, head: bytes) -> None:
+    fernet = Fernet(LEGACY_KEY_FILE.read_bytes())
+    if head == b"gAAA":
+        # A single Fernet token for the whole file (always starts "gAAA")
+        dst.write(fernet.decrypt(head + src.read()))
+        return
+    while len(head) == _LEN.size:
+        (length,) = _LEN.unpack(head)
+        dst.write(fernet.decrypt(src.read(length)))
+        head = src.read(_LEN.size)
+
+def decrypt_audit_file(source_path: Path, dest_path: Path) -> None:
+    with open(source_path, "rb") as src, open(dest_path, "wb") as dst:
+        head = src.read(len(MAGIC))
+        if head != MAGIC:
+            _decrypt_legacy(src, dst, head)
+            return
+        aesgcm = _get_cipher()
+        index = 0
+        head = src.read(_LEN.size)
+        while len(head) == _LEN.size:
+            (length,) = _LEN.unpack(head)
+            sealed = src.read(length)
+            head = src.read(_LEN.size)
+            aad = _AAD.pack(index, not head)
+            dst.write(aesgcm.decrypt(sealed[:12], sealed[12:], aad))
+            index += 1
+        if head:
+            raise ValueError(f"Truncated chunk header in {source_path}")
+
+def _latest_audit_file():
+    return max(
+        (f for f in AUDITS_DIR.glob("security_audit_*.txt") if f.is_file()),
+        key=lambda p: p.stat().st_mtime,
+        default=None,
+    )
 
 def run():
     AUDITS_DIR.mkdir(exist_ok=True)
 
-    # Find the most recent unencrypted audit file (.txt)
-    try:
-        audit_files = sorted(
-            [f for f in AUDITS_DIR.glob("security_audit_*.txt") if f.is_file()],
-            key=os.path.getmtime,
-            reverse=True
-        )
-        if not audit_files:
-            return "[ERROR] No unencrypted audit files found in the /audits directory. Please run a security audit first."
-
-        latest_audit_file = audit_files[0]
-    except Exception as e:
-        return f"[ERROR] Could not search for audit files: {e}"
+    # Look for the newest audit and load (or create) the key side by side;
+    # the directory scan and the key file read don't depend on each other.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        latest_future = pool.submit(_latest_audit_file)
+        cipher_future = pool.submit(_get_cipher)
 
-    # Generate or reuse encryption key
-    if not KEY_FILE.exists():
-        key = Fernet.generate_key()
-        KEY_FILE.write_bytes(key)
-    else:
-        key = KEY_FILE.read_bytes()
+        # Find the most recent unencrypted audit file (.txt)
+        try:
+            latest_audit_file = latest_future.result()
+            if latest_audit_file is None:
+                return "[ERROR] No unencrypted audit files found in the /audits directory. Please run a security audit first."
+        except Exception as e:
+            return f"[ERROR] Could not search for audit files: {e}"
 
-    fernet = Fernet(key)
+        # Generate or reuse encryption key
+        aesgcm = cipher_future.result()
 
     # Encrypt the latest audit file
     try:
-        data_to_encrypt = latest_audit_file.read_bytes()
-        encrypted_data = fernet.encrypt(data_to_encrypt)
-
         encrypted_output_path = latest_audit_file.with_suffix(".txt.encrypted")
-        encrypted_output_path.write_bytes(encrypted_data)
+        encrypt_file(aesgcm, latest_audit_file, encrypted_output_path)
 
         # For security, you might want to remove the original unencrypted file.
         # This is commented out by default to be safe.
@@ -4,12 +4,15 @@ try:
 except ImportError:
     Fernet = None
 
+_DATA = b"User session and config backup"
+_CIPHER = None  # one session key per process, created on first run
+
 def run():
+    global _CIPHER
     if not Fernet:
         return "[ERROR] The 'cryptography' library is not installed. Please run: pip install cryptography"
-    key = Fernet.generate_key()
-    cipher = Fernet(key)
-    data = "User session and config backup"
-    encrypted = cipher.encrypt(data.encode())
+    if _CIPHER is None:
+        _CIPHER = Fernet(Fernet.generate_key())
+    encrypted = _CIPHER.encrypt(_DATA)
     result = "Encrypted session:\\n" + encrypted.decode()
     return result
@@ -5,48 +5,29 @@ Works from ./mnt/data/task_intents_patched.json instead of /mnt/data
 """
 
 import tkinter as tk
-from tkinter import messagebox, ttk
+from tkinter import messagebox
+import importlib.util
+import os
 import shutil
 from pathlib import Path
 
+def _load_phase1_ui():
+    # Loaded by path: plugin loaders exec this file without plugins/ on sys.path
+    path = Path(__file__).resolve().parent.parent / "gui" / "phase1_ui.py"
+    spec = importlib.util.spec_from_file_location("phase1_ui", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+patch_plugin_menu = _load_phase1_ui().patch_plugin_menu
+
 def run():
     try:
         from igris_control_gui_final import App
     except ImportError:
         return "[ERROR] Could not import App from GUI."
 
-    def show_plugin_menu_patch(self):
-        plugins = self.load_plugins()
-        if not plugins:
-            messagebox.showinfo("Plugins", "No plugins found in the plugins directory.")
-            return
-
-        top = tk.Toplevel(self)
-        top.title("Run Plugin")
-        tree = ttk.Treeview(top, columns=("Description",), show="headings")
-        tree.heading("#1", text="Description")
-        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-        scrollbar = ttk.Scrollbar(top, orient=tk.VERTICAL, command=tree.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        tree.configure(yscrollcommand=scrollbar.set)
-
-        for plugin in plugins:
-            tree.insert("", tk.END, iid=plugin['name'], text=plugin['name'], values=(plugin['description'],))
-
-        def run_plugin_wrapper():
-            selected_item = tree.focus()
-            if selected_item:
-                plugin = next((p for p in plugins if p['name'] == selected_item), None)
-                if plugin:
-                    import threading
-                    threading.Thread(target=self.run_plugin, args=(plugin['module'],), daemon=True).start()
-            top.destroy()
-
-        btn = tk.Button(top, text="Run Selected", command=run_plugin_wrapper)
-        btn.pack(pady=10)
-
-    setattr(App, "show_plugin_menu", show_plugin_menu_patch)
+    patch_plugin_menu(App)
 
     # === Patch task_intents.json ===
     patched = Path("mnt/data/task_intents_patched.json")
@@ -56,7 +37,12 @@ def run():
         return "[ERROR] Missing patched task_intents_patched.json file at ./mnt/data"
 
     try:
-        shutil.copyfile(patched, target)
+        try:
+            # Same filesystem: a single rename, nothing copied
+            os.replace(patched, target)
+        except OSError:
+            # Cross-device; copyfile uses sendfile() where the OS has it
+            shutil.copyfile(patched, target)
     except Exception as e:
         return f"[ERROR] Failed to patch task_intents.json: {e}"
 
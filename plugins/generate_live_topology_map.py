@@ -5,9 +5,8 @@ Generate Live Topology Map Plugin
 - Passes the discovered hosts to the GUI to be drawn on a live map.
 """
 import tkinter as tk
-import random
+import math
 import os
-import matplotlib.pyplot as plt
 # --- Import dependent plugins ---
 try:
     # Use the real network scanner
@@ -49,17 +48,16 @@ class TopologyMapWidget(tk.Frame):
         self.canvas.create_oval(center_x-25, center_y-25, center_x+25, center_y+25, fill="gold", outline="white")
         self.canvas.create_text(center_x, center_y, text=f"{gateway['hostname']}\n({gateway['ip']})", fill="black", font=("Segoe UI", 8, "bold"))
 
-        # Draw device nodes around the center
-        angle_step = 360 / len(devices) if devices else 0
+        # Draw device nodes evenly spaced on a circle around the center
+        canvas = self.canvas
+        step = 2 * math.pi / len(devices) if devices else 0
         for i, device in enumerate(devices):
-            angle = i * angle_step
-            rad = (angle * 3.14159) / 180
-        x = center_x + radius * random.uniform(0.8, 1.2) * (1 if i % 2 == 0 else -1) * (i/len(devices))
-        y = center_y + radius * random.uniform(0.8, 1.2) * (1 if i % 2 != 0 else -1) * (i/len(devices))
-        
-        canvas.create_line(center_x, center_y, x, y, fill="gray50", dash=(2, 2))
-        canvas.create_oval(x-20, y-20, x+20, y+20, fill="skyblue", outline="white")
-        canvas.create_text(x, y, text=f"{device['hostname']}\n({device['ip']})", fill="black", font=("Segoe UI", 8))
+            x = center_x + radius * math.cos(i * step)
+            y = center_y + radius * math.sin(i * step)
+
+            canvas.create_line(center_x, center_y, x, y, fill="gray50", dash=(2, 2))
+            canvas.create_oval(x-20, y-20, x+20, y+20, fill="skyblue", outline="white")
+            canvas.create_text(x, y, text=f"{device['hostname']}\n({device['ip']})", fill="black", font=("Segoe UI", 8))
 
 def run():
     print("[INFO] Scanning network to generate live topology map...")
@@ -5,6 +5,8 @@ from pathlib import Path
 
 # Log to the central memory file to be used by the suggestion engine
 MEMORY_FILE = Path.home() / "OneDrive" / "Documents" / "ai_memory.json"
+# Append-only copy of plugin_history that the suggestion engine tails
+PLUGIN_HISTORY_FILE = MEMORY_FILE.with_name("plugin_history.jsonl")
 
 def run(plugin_name="unknown_plugin"):
     now = datetime.now().isoformat()
@@ -28,4 +30,9 @@ def run(plugin_name="unknown_plugin"):
     with MEMORY_FILE.open("w", encoding="utf-8") as f:
         json.dump(memory, f, indent=2)
 
+    # Seed the sidecar with the full history the first time, then append one line per run
+    new_entries = [log_entry] if PLUGIN_HISTORY_FILE.exists() else memory["plugin_history"]
+    with PLUGIN_HISTORY_FILE.open("a", encoding="utf-8") as f:
+        f.writelines(json.dumps(entry) + "\n" for entry in new_entries)
+
     return f"Logged execution of {plugin_name} to ai_memory.json"
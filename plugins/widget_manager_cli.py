@@ -4,7 +4,9 @@ Plugin to manage Igris Desktop widgets via the command line.
 """
 import argparse
 import json
+import os
 import sys
+import tempfile
 from pathlib import Path
 from datetime import datetime
 import threading
@@ -20,11 +22,30 @@ CONFIG_DIR = ROOT_DIR / "ai_assistant_config"
 DESKTOP_COMMAND_QUEUE_FILE = CONFIG_DIR / "desktop_command_queue.json"
 DESKTOP_COMMAND_LOCK = threading.Lock()
 
+GUI_DIR = ROOT_DIR / "gui"
+if str(GUI_DIR) not in sys.path:
+    sys.path.insert(0, str(GUI_DIR))
+
+try:
+    from igris_shell import send_shell_command
+except ImportError:
+    send_shell_command = None
+
 def send_desktop_command(action, params=None):
-    """A helper to send a command to the Igris Shell via the file queue."""
+    """
+    A helper to send a command to the Igris Shell.
+    Uses the shell's command socket when it is running, else the file queue.
+    """
     if params is None:
         params = {}
 
+    if send_shell_command is not None:
+        try:
+            send_shell_command(action, params)
+            return f"[Desktop] Sent command: '{action}' with params {params}"
+        except OSError:
+            pass  # shell not listening (or no token yet); queue it on disk instead
+
     command = {
         "timestamp": datetime.now().isoformat(),
         "action": action,
@@ -42,7 +63,11 @@ def send_desktop_command(action, params=None):
         queue.append(command)
 
         try:
-            DESKTOP_COMMAND_QUEUE_FILE.write_text(json.dumps(queue, indent=2), encoding="utf-8")
+            # Write a temp file and swap it in, so the shell never reads a partial queue.
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=CONFIG_DIR,
+                                             suffix=".tmp", delete=False) as tmp:
+                json.dump(queue, tmp, indent=2)
+            os.replace(tmp.name, DESKTOP_COMMAND_QUEUE_FILE)
             return f"[Desktop] Sent command: '{action}' with params {params}"
         except IOError as e:
             return f"[ERROR] Failed to write to desktop command queue: {e}"
@@ -0,0 +1,85 @@
+import os
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "plugins"))
+import encrypt_audit_output as audit
+
+
+@pytest.fixture
+def audits_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(audit, "AUDITS_DIR", tmp_path)
+    monkeypatch.setattr(audit, "KEY_FILE", tmp_path / "audit.key")
+    monkeypatch.setattr(audit, "LEGACY_KEY_FILE", tmp_path / "legacy.key")
+    monkeypatch.setattr(audit, "_CIPHER", None)
+    return tmp_path
+
+
+@pytest.mark.parametrize("size", [0, 1, audit.CHUNK_SIZE, audit.CHUNK_SIZE + 1, 3 * audit.CHUNK_SIZE])
+def test_round_trip(audits_dir, size):
+    data = os.urandom(size)
+    src, enc, out = audits_dir / "a.txt", audits_dir / "a.enc", audits_dir / "a.out"
+    src.write_bytes(data)
+    audit.encrypt_file(audit._get_cipher(), src, enc)
+    assert enc.read_bytes().startswith(audit.MAGIC)
+    audit.decrypt_audit_file(enc, out)
+    assert out.read_bytes() == data
+
+
+def _frames(blob):
+    frames, pos = [], len(audit.MAGIC)
+    while pos < len(blob):
+        (length,) = struct.unpack("!I", blob[pos:pos + 4])
+        frames.append(blob[pos:pos + 4 + length])
+        pos += 4 + length
+    return frames
+
+
+@pytest.mark.parametrize("tamper", ["truncate", "reorder"])
+def test_dropped_or_reordered_chunks_are_rejected(audits_dir, tamper):
+    src, enc = audits_dir / "a.txt", audits_dir / "a.enc"
+    src.write_bytes(os.urandom(2 * audit.CHUNK_SIZE + 10))
+    audit.encrypt_file(audit._get_cipher(), src, enc)
+    frames = _frames(enc.read_bytes())
+    assert len(frames) == 3
+    frames = frames[:-1] if tamper == "truncate" else [frames[1], frames[0], frames[2]]
+    enc.write_bytes(audit.MAGIC + b"".join(frames))
+    with pytest.raises(InvalidTag):
+        audit.decrypt_audit_file(enc, audits_dir / "a.out")
+
+
+def test_legacy_fernet_files_still_decrypt(audits_dir):
+    key = Fernet.generate_key()
+    audit.LEGACY_KEY_FILE.write_bytes(key)
+    fernet = Fernet(key)
+    data = os.urandom(100_000)
+    out = audits_dir / "a.out"
+
+    whole = audits_dir / "whole.enc"
+    whole.write_bytes(fernet.encrypt(data))
+    audit.decrypt_audit_file(whole, out)
+    assert out.read_bytes() == data
+
+    chunked = audits_dir / "chunked.enc"
+    with open(chunked, "wb") as f:
+        for i in range(0, len(data), audit.CHUNK_SIZE):
+            token = fernet.encrypt(data[i:i + audit.CHUNK_SIZE])
+            f.write(struct.pack("!I", len(token)) + token)
+    audit.decrypt_audit_file(chunked, out)
+    assert out.read_bytes() == data
+
+
+def test_run_encrypts_newest_audit(audits_dir):
+    assert audit.run().startswith("[ERROR] No unencrypted audit files")
+    old, new = audits_dir / "security_audit_1.txt", audits_dir / "security_audit_2.txt"
+    old.write_text("old")
+    new.write_text("new")
+    os.utime(old, (1, 1))
+    assert "security_audit_2.txt" in audit.run()
+    audit.decrypt_audit_file(audits_dir / "security_audit_2.txt.encrypted", audits_dir / "a.out")
+    assert (audits_dir / "a.out").read_text() == "new"
@@ -0,0 +1,54 @@
+import importlib.util
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+# Loaded under its own name; core/igris_core.py already owns "igris_core".
+_PATH = Path(__file__).resolve().parent.parent / "igris_phase3_patch_20250810_224424" / "igris_core.py"
+_spec = importlib.util.spec_from_file_location("igris_phase3_core", _PATH)
+phase3 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(phase3)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('noise {"a": 1} tail', '{"a": 1}'),
+    ('x {"s": "}{", "n": {"b": [1, 2]}} {"later": 1}', '{"s": "}{", "n": {"b": [1, 2]}}'),
+    ('{"q": "say \\"}\\" now"} y', '{"q": "say \\"}\\" now"}'),
+    ('{"é": "ünï"} after', '{"é": "ünï"}'),
+    ("no object", "no object"),
+    ('{"open": 1', '{"open": 1'),
+])
+def test_extract_jsonish(text, expected):
+    assert phase3._extract_jsonish(text) == expected
+
+
+def test_brace_scanner_is_chunking_independent():
+    rng = random.Random(42)
+    for _ in range(200):
+        obj = {"k": "".join(rng.choices('{}"\\ab é', k=rng.randint(0, 12))), "n": {"x": [1, {"y": "}"}]}}
+        raw = "text " + json.dumps(obj, ensure_ascii=False) + " tail"
+        data = raw.encode("utf-8")
+        scanner = phase3._BraceScanner()
+        end, pos = -1, 0
+        while end == -1 and pos < len(data):
+            step = rng.randint(1, 7)
+            end = scanner.feed(data[pos:pos + step])
+            pos += step
+        assert json.loads(scanner.buf[scanner.start:end].decode("utf-8")) == obj
+
+
+def test_strip_md_fences():
+    assert phase3._strip_md_fences('```json\n{"a": 1}\n```') == '{"a": 1}'
+    assert phase3._strip_md_fences('  {"a": 1}  ') == '{"a": 1}'
+
+
+def test_verify_admin_pin_leaves_policy_untouched():
+    import hashlib
+    policy = {"admin_pin_hash": hashlib.sha256(b"1234").hexdigest()}
+    assert phase3.verify_admin_pin("1234", policy)
+    assert not phase3.verify_admin_pin("4321", policy)
+    assert not phase3.verify_admin_pin("1234", {"admin_pin_hash": "not-hex"})
+    json.dumps(policy)
+    assert set(policy) == {"admin_pin_hash"}